@@ -2,7 +2,7 @@ from discord import NotFound, ClientException, Forbidden, HTTPException
 from discord.ext.commands import Context
 
 import modules
-from modules import CustomCog, owner_only, guild_only, partner_only
+from modules import CustomCog, owner_only, guild_only, partner_only, ChainedEmbed, google_api_stats
 from modules.custom.custom_bot import CustomBot
 from utils import get_cog, literals, reload_literals, Log
 
@@ -42,6 +42,28 @@ class ControlCog(CustomCog, name=get_cog('ControlCog')['name']):
             raise e
         await ctx.channel.send(literals('delete')['done'] % count, delete_after=10)
 
+    @modules.command(name='통계', aliases=('stats',))
+    @owner_only()
+    async def stats(self, ctx: Context, *, command_name: str = ''):
+        literal = literals('stats')
+        records = [(name, record) for name, record in self.client.command_stats.sorted_records()
+                   if name == command_name or name.startswith(command_name + ' ') or not command_name]
+        if not records:
+            await ctx.send(literal['not_found'])
+            return
+        embeds = ChainedEmbed(title=literal['title'],
+                              description=literal['description'] % (self.client.command_stats.started_at
+                                                                    .strftime('%Y-%m-%d %H:%M'), len(records)))
+        embeds.set_thumbnail(url=self.client.user.avatar_url)
+        embeds.add_fields((name, literal['field'] % (record.invocations, record.error_rate * 100, record.cooldowns,
+                                                     record.preparation.percentile(50),
+                                                     record.latency.percentile(50), record.latency.percentile(90),
+                                                     record.latency.percentile(99), record.latency.max / 1000))
+                          for name, record in records)
+        embeds.set_footer(text=literal['google_api'] % google_api_stats)
+        for embed in embeds.to_list():
+            await ctx.send(embed=embed)
+
     @modules.group(name='리로드', enabled=False)
     @owner_only()
     async def reload(self, ctx: Context):
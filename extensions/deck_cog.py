@@ -7,9 +7,10 @@ from discord.abc import GuildChannel
 from discord.ext.commands import Bot, Context, BadArgument, check, BucketType, MemberConverter
 
 import modules
-from modules import CustomCog, ChainedEmbed, shared_cooldown, DeckHandler, Deck, DeckConverter, guild_only
+from modules import CustomCog, ChainedEmbed, shared_cooldown, DeckHandler, Deck, DeckConverter, guild_only, \
+    BulkExecutor, BulkReport
 from utils import get_cog, literals, get_emoji, wrap_codeblock, get_constant, check_length, attach_toggle_interface, \
-    InterfaceState
+    InterfaceState, attach_page_interface
 
 FAILED_EMOJI = get_emoji(':negative_squared_cross_mark:')
 CONFIRM_EMOJI = get_emoji(':white_check_mark:')
@@ -21,6 +22,9 @@ DECK_END_TIMEOUT = 30
 
 CHANNEL_DELETE_DELAY = 120
 
+DECK_LIST_PAGE_LINES = 20
+DECK_LIST_PAGE_LENGTH = 2000
+
 
 def wait_until_deck_handler_ready():
     async def predicate(ctx: Context) -> bool:
@@ -50,15 +54,15 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
         super().__init__(client)
         self.client: Bot = client
         self.deck_handler: DeckHandler = DeckHandler(client)
+        client.add_shutdown_hook(self.deck_handler.flush_decks)
+
+    def cog_unload(self):
+        self.client.remove_shutdown_hook(self.deck_handler.flush_decks)
+        self.client.loop.create_task(self.deck_handler.flush_decks())
 
-    async def get_deck_embed(self, deck: Deck, brief: bool = True) -> ChainedEmbed:
+    def get_deck_embed(self, deck: Deck, brief: bool = True) -> ChainedEmbed:
         literal = literals('get_deck_embed')
         deck_embed = ChainedEmbed(title=literal['title'] % deck.name, description=deck.topic)
-        deck_role = discord.utils.get(await self.deck_handler.guild.fetch_roles(), name=deck.name)
-        deck_members = list()
-        async for member in self.deck_handler.guild.fetch_members():
-            if deck_role in member.roles:
-                deck_members.append(str(member))
         deck_embed.set_thumbnail(url=deck.manager.avatar_url)
         deck_embed.add_field(name=literal['manager'], value=str(deck.manager))
         if deck.public:
@@ -73,7 +77,7 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
             deck_embed.add_field(name=literal['pending'] % len(deck.pending),
                                  value=' '.join([str(member) for member in deck.pending]))
         if not brief:
-            if deck_members:
+            if deck_members := [str(member) for member in self.deck_handler.get_deck_members(deck)]:
                 deck_embed.add_field(name=literal['members'] % len(deck_members), value='\n'.join(deck_members),
                                      inline=True)
             channels = list()
@@ -89,29 +93,31 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
         check_deck_manager(deck, ctx.author)
         literal = literals('accept_joining')
 
-        async def accept_joining_(member: Member):
-            await member.add_roles(deck.role)
-            deck.pending.remove(member)
-
         pending = [member for member in members if member in deck.pending]
         if not pending:
             raise BadArgument('no pending found')
-        tasks = [accept_joining_(member) for member in pending]
-        if tasks:
-            message = await ctx.send(literal['start'] % len(tasks))
-            done, yet = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
-            for coro in done:
-                if (e := coro.exception()) is not None:
-                    await self.deck_handler.fetch_deck(deck.default_channel)
-                    raise e
+        message = await ctx.send(literal['start'] % len(pending))
+
+        async def progress(report: BulkReport):
+            await message.edit(content=literal['progress'] % (report.finished, report.total))
+
+        report = await BulkExecutor(progress=progress).run(pending, lambda member: member.add_roles(deck.role))
+        for member in report.done:
+            deck.pending.remove(member)
+        if report.done:
             await self.deck_handler.update_deck(deck)
-            await message.edit(content=literal['done'] % (' '.join([str(member) for member in pending]), deck.name))
+        lines = list()
+        if report.done:
+            lines.append(literal['done'] % (' '.join([str(member) for member in report.done]), deck.name))
+        if report.failed:
+            lines.append(literal['failed'] % ' '.join([str(member) for member in report.failed_items]))
+        await message.edit(content='\n'.join(lines))
 
     async def edit_deck_topic(self, ctx: Context, deck: Deck, new_topic: str):
         literal = literals('edit_deck_topic')
         old_topic = wrap_codeblock(deck.topic, markdown='')[0]
         deck.topic = new_topic
-        deck_embed = await self.get_deck_embed(deck)
+        deck_embed = self.get_deck_embed(deck)
         deck_embed.clear_fields()
         deck_embed.add_field(name=literal['before'], value=old_topic)
         await self.save_deck(ctx, deck, deck_embed)
@@ -120,7 +126,7 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
         literal = literals('change_deck_id')
         old_id = '`' + deck.id + '`'
         deck.id = new_id
-        deck_embed = await self.get_deck_embed(deck)
+        deck_embed = self.get_deck_embed(deck)
         deck_embed.clear_fields()
         deck_embed.add_field(name=literal['before'], value=old_id)
         await self.save_deck(ctx, deck, deck_embed)
@@ -129,19 +135,20 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
         literal = literals('change_deck_name')
         old_name = wrap_codeblock(deck.name, markdown='')[0]
         deck.name = new_name
-        deck_embed = await self.get_deck_embed(deck)
+        deck_embed = self.get_deck_embed(deck)
         deck_embed.clear_fields()
         deck_embed.add_field(name=literal['before'], value=old_name)
 
         async def change_deck_name_():
             await asyncio.wait([deck.category_channel.edit(name=new_name), deck.role.edit(name=new_name)])
+            self.deck_handler.decks[deck.category_channel.id] = deck
 
         await self.save_deck(ctx, deck, deck_embed, change_deck_name_())
 
     async def save_deck(self, ctx: Context, deck: Deck, deck_embed: ChainedEmbed = None, save: Coroutine = None):
         literal = literals('save_deck')
         if deck_embed is None:
-            deck_embed = await self.get_deck_embed(deck)
+            deck_embed = self.get_deck_embed(deck)
         if save is None:
             save = self.deck_handler.update_deck(deck)
         message = await ctx.send(literal['start'], embed=deck_embed)
@@ -149,9 +156,36 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
         await message.edit(content=literal['done'] % deck.name)
 
     @CustomCog.listener()
-    async def on_guild_channel_update(self, before: GuildChannel, _: GuildChannel):
-        if self.deck_handler.get_deck_by_channel(before) is not None and self.deck_handler.ready:
-            await self.deck_handler.fetch_decks()
+    async def on_guild_channel_update(self, before: GuildChannel, after: GuildChannel):
+        await self.deck_handler.reconcile_channel(before, after)
+
+    @CustomCog.listener()
+    async def on_guild_channel_create(self, channel: GuildChannel):
+        await self.deck_handler.reconcile_channel(None, channel)
+
+    @CustomCog.listener()
+    async def on_guild_channel_delete(self, channel: GuildChannel):
+        self.deck_handler.forget_channel(channel)
+
+    @CustomCog.listener()
+    async def on_guild_role_create(self, role: Role):
+        self.deck_handler.reconcile_role(None, role)
+
+    @CustomCog.listener()
+    async def on_guild_role_update(self, before: Role, after: Role):
+        self.deck_handler.reconcile_role(before, after)
+
+    @CustomCog.listener()
+    async def on_guild_role_delete(self, role: Role):
+        self.deck_handler.reconcile_role(role, None)
+
+    @CustomCog.listener()
+    async def on_member_update(self, before: Member, after: Member):
+        self.deck_handler.update_member(before, after)
+
+    @CustomCog.listener()
+    async def on_member_remove(self, member: Member):
+        self.deck_handler.remove_member(member)
 
     @modules.group(name='데크')
     @wait_until_deck_handler_ready()
@@ -180,24 +214,46 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
             if (deck := self.deck_handler.get_deck_by_channel(ctx.channel)) is None:
                 await self.deck_list(ctx)
                 return
-        message = await ctx.send(embed=await self.get_deck_embed(deck))
+        brief_embed = self.get_deck_embed(deck)
+        full_embed = self.get_deck_embed(deck, False)
+        message = await ctx.send(embed=brief_embed)
         await attach_toggle_interface(
             self.client, message,
-            InterfaceState(message.edit, embed=(first_embed := await self.get_deck_embed(deck))),
-            InterfaceState(message.edit, embed=await self.get_deck_embed(deck, False)),
-            after=message.edit(embed=first_embed))
+            InterfaceState(message.edit, embed=brief_embed),
+            InterfaceState(message.edit, embed=full_embed),
+            after=message.edit(embed=brief_embed))
 
     @deck_.command(name='목록', aliases=('리스트', '전체'))
     @wait_until_deck_handler_ready()
-    async def deck_list(self, ctx: Context):
+    async def deck_list(self, ctx: Context, filter_: str = ''):
         literal = literals('deck_list')
-        list_embeds = ChainedEmbed(title=literal['title'],
-                                   description='\n'.join([deck.get_brief()
-                                                          for deck in sorted(self.deck_handler.decks.values(),
-                                                                             key=lambda item: item.id)]))
-        list_embeds.set_thumbnail(url=self.client.user.avatar_url)
-        for embed in list_embeds.to_list():
-            await ctx.send(embed=embed)
+        if filter_ and filter_ not in literal['filters']:
+            await ctx.send(literal['invalid_filter'] % (filter_, ', '.join(f'`{name}`' for name in literal['filters'])))
+            raise BadArgument(f'unknown deck filter: {filter_}')
+        briefs = self.deck_handler.decks.sorted_briefs(literal['filters'].get(filter_))
+        bounds = [0]
+        length = 0
+        for i, brief in enumerate(briefs):
+            if i - bounds[-1] >= DECK_LIST_PAGE_LINES or length + len(brief) + 1 > DECK_LIST_PAGE_LENGTH:
+                bounds.append(i)
+                length = 0
+            length += len(brief) + 1
+        bounds.append(len(briefs))
+        pages = max(len(bounds) - 1, 1)
+
+        def render(page: int) -> ChainedEmbed:
+            page_embed = ChainedEmbed(title=literal['title'],
+                                      description='\n'.join(briefs[bounds[page]:bounds[page + 1]]) or literal['empty'])
+            page_embed.set_thumbnail(url=self.client.user.avatar_url)
+            page_embed.set_footer(text=literal['footer'] % (page + 1, pages, len(briefs)))
+            return page_embed
+
+        async def show(page: int):
+            await message.edit(embed=render(page))
+
+        message = await ctx.send(embed=render(0))
+        await attach_page_interface(self.client, message, [InterfaceState(show, page) for page in range(pages)],
+                                    user=ctx.author)
 
     @deck_.command(name='가입', aliases=('신청', '가입신청', '들어가기'))
     @wait_until_deck_handler_ready()
@@ -379,7 +435,7 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
                 break
             message = await ctx.send(literal['start'])
             deck = await self.deck_handler.add_deck(description, manager)
-            deck_embed = await self.get_deck_embed(deck)
+            deck_embed = self.get_deck_embed(deck)
             tasks = [message.edit(content=(done_str := literal['done'] % description), embed=deck_embed)]
             if message.channel != partner_channel:
                 tasks.append(partner_channel.send(done_str, embed=deck_embed))
@@ -419,8 +475,15 @@ class DeckCog(CustomCog, name=get_cog('DeckCog')['name']):
                 await message.delete()
 
             message = await ctx.send(literal['start'] % deck.name)
-            deck_embed = await self.get_deck_embed(deck)
-            await self.deck_handler.remove_deck(deck)
+            deck_embed = self.get_deck_embed(deck)
+
+            async def progress(report_: BulkReport):
+                await message.edit(content=literal['progress'] % (deck.name, report_.finished, report_.total))
+
+            report = await self.deck_handler.remove_deck(deck, progress)
+            if report.failed:
+                await message.edit(content=literal['failed'] % (deck.name, len(report.failed)))
+                return
             await asyncio.wait([
                 message.delete(), author.send(done_str := literal['done'] % deck.name, embed=deck_embed),
                 deck.manager.send(done_str, embed=deck_embed),
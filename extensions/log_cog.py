@@ -6,7 +6,7 @@ from discord.ext.commands import Bot, Context, CommandNotFound, CheckFailure, Mi
     DisabledCommand, CommandOnCooldown, BadUnionArgument, BadArgument
 
 from modules.custom.custom_cog import CustomCog
-from utils import wrap_codeblock
+from utils import iter_codeblocks
 from utils.literal import get_cog, literals, get_constant
 from utils.log import Log
 
@@ -48,7 +48,7 @@ class LogCog(CustomCog, name=get_cog('LogCog')['name']):
             error_message = f'{ctx.guild}/{ctx.channel}/{ctx.author}: {ctx.message.content}\n{ctx.message.jump_url}\n\n'
             error_message += '\n'.join(traceback.format_exception(etype=type(error), value=error,
                                                                   tb=error.__traceback__))
-            for e in wrap_codeblock(error_message, markdown=''):
+            for e in iter_codeblocks(error_message.split('\n'), markdown=''):
                 await self.owner.send(e)
         raise error
 
@@ -5,10 +5,11 @@ from discord.ext import commands
 from discord.ext.commands import Bot, Context, TextChannelConverter, BadArgument
 
 from extensions.shtelo_cog import get_application_sheet
-from modules import BotProtocol, Request, CustomCog, doc_read
-from utils import get_cog, get_constant, Log, literals, FreshData, split_by_length
+from modules import BotProtocol, Request, CustomCog, doc_read_async
+from utils import get_cog, get_constant, Log, literals, FreshCache, iter_by_length
 
 MESSAGE_MAX_LENGTH = 2000
+HOLDING_EXPIRE = 3600
 
 class ProtocolCog(CustomCog, BotProtocol, name=get_cog('ProtocolCog')['name']):
     """
@@ -18,7 +19,7 @@ class ProtocolCog(CustomCog, BotProtocol, name=get_cog('ProtocolCog')['name']):
     def __init__(self, client: Bot):
         super().__init__(client)
         self.client: Bot = client
-        self.holding_data: dict = dict()
+        self.holding_data: FreshCache = FreshCache(HOLDING_EXPIRE)
         self.done: list = list()
 
     @CustomCog.listener()
@@ -67,19 +68,17 @@ class ProtocolCog(CustomCog, BotProtocol, name=get_cog('ProtocolCog')['name']):
             here_request = request.generate_respond(signal=BotProtocol.HERE, addition=key_ + ' ')
             addition_length = MESSAGE_MAX_LENGTH - len(str(here_request)) - 1
             here_request.addition += data_[:addition_length]
-            data_ = data_[addition_length:]
             await request.message.channel.send(str(here_request), delete_after=1)
-            if data_:
-                for d in split_by_length(data_):
-                    await request.message.channel.send(d, delete_after=1)
+            for d in iter_by_length((data_[addition_length:],)):
+                await request.message.channel.send(d, delete_after=1)
             done_request = request.generate_respond(signal=BotProtocol.DONE, addition=key_)
             await request.message.channel.send(str(done_request), delete_after=1)
 
         if key == literal['application']:
-            data = json.dumps(get_application_sheet(), ensure_ascii=False)
+            data = json.dumps(await get_application_sheet(), ensure_ascii=False)
             await respond(data, key)
         if key == literal['regulation']:
-            data = doc_read(get_constant('regulation')['doc_id'])
+            data = await doc_read_async(get_constant('regulation')['doc_id'])
             await respond(data, key)
 
     async def on_here(self, request: Request):
@@ -93,9 +92,7 @@ class ProtocolCog(CustomCog, BotProtocol, name=get_cog('ProtocolCog')['name']):
             message = await self.client.wait_for('message', check=lambda msg: msg.author == request.message.author)
             data += message.content
         self.done.pop(-1)
-        if key not in self.holding_data:
-            self.holding_data[key] = list()
-        self.holding_data[key].append(FreshData(data))
+        self.holding_data.set(key, self.holding_data.peek(key, tuple()) + (data,))
 
     async def on_done(self, request: Request):
         self.done.append(request)
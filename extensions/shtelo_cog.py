@@ -1,14 +1,16 @@
 import asyncio
+import re
+from time import monotonic
 from typing import Optional
 
 from discord import Member, Message, TextChannel, Role, Guild
 from discord.ext.commands import Bot, Context, BucketType, BadArgument, MemberConverter
 
 import modules
-from modules import CustomCog, sheet_read, ChainedEmbed, doc_read, shared_cooldown, DeckHandler, sheet_write, \
-    partner_only, guild_only
-from utils import get_cog, literals, wrap_codeblock, get_constant, FreshData, get_emoji, InterfaceState, \
-    attach_page_interface, to_kst
+from modules import CustomCog, sheet_read_async, ChainedEmbed, doc_read_async, shared_cooldown, DeckHandler, \
+    sheet_write_async, partner_only, guild_only, sheet_append_async, sheet_batch_read_async, sheet_batch_write_async
+from utils import get_cog, literals, wrap_codeblock, iter_codeblocks, get_constant, FreshCache, get_emoji, \
+    InterfaceState, attach_page_interface, to_kst, Log
 
 NO = '아니오'
 
@@ -29,12 +31,21 @@ MEMBER_LIST_NICKNAME = 1
 MEMBER_LIST_STATE = 2
 MEMBER_LIST_ID = 3
 MEMBER_LIST_JOINED_AT = 4
+MEMBER_LIST_COLUMNS = 5
+
+MEMBER_LIST_ROW_REGEX = re.compile('![A-Z]+(\\d+)')
+MEMBER_LIST_WRITE_WINDOW = 1.0
+MEMBER_LIST_RETRIES = 3
 
 APPLICATION_RECEIVED = '접수됨'
 APPLICATION_APPROVED = '승인됨'
 
 SECOND_PER_HOUR = 3600
 
+APPLICATION_TTL = 300
+APPLICATION_FULL_REFRESH = SECOND_PER_HOUR
+APPLICATION_MISS_INTERVAL = 30
+
 NSFW_TIMEOUT = 60
 NSFW_EMOJI = get_emoji(':underage:')
 
@@ -43,84 +54,326 @@ CONFIRM_EMOJI = get_emoji(':white_check_mark:')
 deck_cooldown = shared_cooldown(1, 60, BucketType.category)
 
 
-def get_application_sheet():
-    sheet = get_constant('application')
-    rows = sheet_read(sheet['sheet_id'], sheet['read_range'])
-    keys = rows.pop(0)
-    for reply in rows:
-        while len(reply) < len(keys):
-            reply.append('')
-    return keys, rows
+def pad_row(row: list, length: int) -> list:
+    while len(row) < length:
+        row.append('')
+    return row
+
+
+class ApplicationStore:
+    """
+    Local mirror of the application sheet, indexed by Discord tag, by member id found in the remarks of main
+    accounts, by nickname and by state.
+
+    Rows appended by the form after the mirrored ones are read every ``ttl`` seconds, and the whole sheet is reread
+    every ``full_refresh`` seconds to pick up the edits made by hand.
+    """
+    MEMBER_ID_REGEX = re.compile('\\d{15,21}')
+
+    def __init__(self, ttl: float = APPLICATION_TTL, full_refresh: float = APPLICATION_FULL_REFRESH,
+                 miss_interval: float = APPLICATION_MISS_INTERVAL):
+        self.ttl: float = ttl
+        self.full_refresh: float = full_refresh
+        self.miss_interval: float = miss_interval
+        self.keys: list = list()
+        self.rows: list = list()
+        self.by_tag: dict = dict()
+        self.by_member_id: dict = dict()
+        self.by_nickname: dict = dict()
+        self.by_state: dict = dict()
+        self.loaded_at: Optional[float] = None
+        self.fully_loaded_at: Optional[float] = None
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.refreshing_recent: Optional[asyncio.Task] = None
+
+    def index_keys(self, row: list) -> tuple:
+        member_ids = tuple(int(id_) for id_ in self.MEMBER_ID_REGEX.findall(row[APPLICATION_REMARKS])) \
+            if row[APPLICATION_SUBACCOUNT] == NO else ()
+        return row[APPLICATION_DISCORD_ID], member_ids, row[APPLICATION_NICKNAME], row[APPLICATION_STATE]
+
+    def index(self, i: int, row: list):
+        tag, member_ids, nickname, state = self.index_keys(row)
+        self.by_tag.setdefault(tag, list()).append(i)
+        for member_id in member_ids:
+            self.by_member_id.setdefault(member_id, list()).append(i)
+        self.by_nickname.setdefault(nickname, list()).append(i)
+        self.by_state.setdefault(state, set()).add(i)
+
+    def unindex(self, i: int, row: list):
+        tag, member_ids, nickname, state = self.index_keys(row)
+        self.by_tag[tag].remove(i)
+        for member_id in member_ids:
+            self.by_member_id[member_id].remove(i)
+        self.by_nickname[nickname].remove(i)
+        self.by_state[state].discard(i)
+
+    def append(self, rows: list):
+        for row in rows:
+            self.rows.append(pad_row(row, len(self.keys)))
+            self.index(len(self.rows) - 1, row)
+
+    async def refresh(self, force: bool = False, ttl: Optional[float] = None):
+        async with self.lock:
+            now = monotonic()
+            if force or self.fully_loaded_at is None or now - self.fully_loaded_at >= self.full_refresh:
+                await self.load()
+            elif now - self.loaded_at >= (self.ttl if ttl is None else ttl):
+                await self.load_delta()
+
+    async def refresh_recent(self):
+        """
+        Reads the rows appended since the last read, waiting until ``miss_interval`` seconds have passed since it.
+        Callers arriving while a read is waiting or running share that read.
+        """
+        if self.refreshing_recent is None or self.refreshing_recent.done():
+            self.refreshing_recent = asyncio.get_event_loop().create_task(self._refresh_recent())
+        await asyncio.shield(self.refreshing_recent)
+
+    async def _refresh_recent(self):
+        if self.loaded_at is not None and (delay := self.loaded_at + self.miss_interval - monotonic()) > 0:
+            await asyncio.sleep(delay)
+        await self.refresh(ttl=0)
+
+    async def load(self):
+        sheet = get_constant('application')
+        rows = await sheet_read_async(sheet['sheet_id'], sheet['read_range'])
+        self.keys = rows.pop(0)
+        self.rows = list()
+        self.by_tag, self.by_member_id, self.by_nickname, self.by_state = dict(), dict(), dict(), dict()
+        self.append(rows)
+        self.fully_loaded_at = self.loaded_at = monotonic()
+
+    async def load_delta(self):
+        """
+        Reads the rows after the last mirrored one, starting from the last mirrored row itself. If that row has moved
+        because rows were inserted or deleted by hand, the whole sheet is reread instead.
+        """
+        sheet = get_constant('application')
+        rows = await sheet_read_async(sheet['sheet_id'], sheet['delta_range'].format(len(self.rows) + 1))
+        last = self.rows[-1] if self.rows else self.keys
+        if not rows or not self.matches(rows[0], last):
+            Log.auto('application sheet rows have moved; rereading the sheet')
+            await self.load()
+            return
+        self.append(rows[1:])
+        self.loaded_at = monotonic()
+
+    def matches(self, row: list, mirrored: list) -> bool:
+        """
+        Tells whether ``row`` read from the sheet is still ``mirrored``, ignoring the period that changes every day.
+        """
+        return pad_row(row.copy(), len(mirrored))[:APPLICATION_PERIOD] == mirrored[:APPLICATION_PERIOD]
+
+    def update(self, i: int, row: list):
+        self.unindex(i, self.rows[i])
+        self.rows[i] = pad_row(row, len(self.keys))
+        self.index(i, row)
+
+    def indexes_of(self, member: Member) -> list:
+        return self.by_tag.get(str(member), list()) + self.by_member_id.get(member.id, list())
+
+    def application_of(self, member: Member) -> Optional[list]:
+        if indexes := self.indexes_of(member):
+            return self.rows[max(indexes)]
+
+    def nickname_of(self, member: Member) -> Optional[str]:
+        if indexes := self.indexes_of(member):
+            return self.rows[min(indexes)][APPLICATION_NICKNAME]
+
+    def is_pending(self, member: Member) -> bool:
+        """
+        Tells from the mirror alone, without reading the sheet, whether the latest application of ``member`` is
+        still unprocessed.
+        """
+        return (application := self.application_of(member)) is not None and not application[APPLICATION_STATE]
+
+    async def refresh_periodically(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                Log.error(f'failed to refresh the application sheet: {e}')
+            await asyncio.sleep(self.ttl)
+
+    def get_by_state(self, *states: str) -> list:
+        return [self.rows[i] for i in sorted(set().union(*[self.by_state.get(state, ()) for state in states]))]
+
 
+application_store = ApplicationStore()
 
-def get_application_of(member: Member, rows=None):
-    if rows is None:
-        _, rows = get_application_sheet()
-    for row in reversed(rows):
-        if row[APPLICATION_SUBACCOUNT] == NO and str(member.id) in row[APPLICATION_REMARKS] \
-                or str(member) == row[APPLICATION_DISCORD_ID]:
-            return row
 
+async def get_application_sheet():
+    await application_store.refresh()
+    return application_store.keys, application_store.rows
 
-def get_nickname_of(member: Member, rows=None):
-    if rows is None:
-        _, rows = get_application_sheet()
-    for row in rows:
-        if row[APPLICATION_SUBACCOUNT] == NO and str(member.id) in row[APPLICATION_REMARKS] \
-                or str(member) == row[APPLICATION_DISCORD_ID]:
-            return row[APPLICATION_NICKNAME]
 
+async def get_application_of(member: Member):
+    await application_store.refresh()
+    return application_store.application_of(member)
 
-async def update_application(member: Member, state: str, remarks: str, on_error=None, keys=None, rows=None):
+
+async def get_nickname_of(member: Member):
+    await application_store.refresh()
+    return application_store.nickname_of(member)
+
+
+async def update_application(member: Member, state: str, remarks: str, on_error=None):
+    """
+    Writes the state, remarks and period cells of the first application of ``member`` not yet in ``state``.
+
+    The row is read again right before writing. If it no longer matches the mirror, nothing is written and the sheet
+    is reread, so that neither a hand edit nor a row moved by hand is overwritten. The mirror is locked from choosing
+    the row until it is updated, so that a refresh cannot move the row in between.
+    """
     sheet = get_constant('application')
-    if keys is None or rows is None:
-        keys, rows = get_application_sheet()
-    result = False
-    for i, row in enumerate(rows):
-        if str(member) in row and row[APPLICATION_STATE] != state:
-            row[APPLICATION_STATE] = state
-            if remarks is not None and not row[APPLICATION_REMARKS]:
-                row[APPLICATION_REMARKS] = str(remarks).replace('->', '→')
-            result = row.copy()
-            break
-    if not result:
-        if on_error is not None:
-            await on_error()
+    await application_store.refresh()
+    async with application_store.lock:
+        for i in sorted(application_store.by_tag.get(str(member), ())):
+            if (row := application_store.rows[i])[APPLICATION_STATE] != state:
+                break
+        else:
+            i = None
+        if i is not None:
+            current = await sheet_read_async(sheet['sheet_id'], sheet['insert_range'].format(i + 2))
+            if current and application_store.matches(current[0], row):
+                row = row.copy()
+                row[APPLICATION_STATE] = state
+                if remarks is not None and not row[APPLICATION_REMARKS]:
+                    row[APPLICATION_REMARKS] = str(remarks).replace('->', '→')
+                result = row.copy()
+                result[APPLICATION_PERIOD] = sheet['active_time_formula'].format(i + 2)
+                await sheet_write_async(sheet['sheet_id'], sheet['state_range'].format(i + 2),
+                                        [result[APPLICATION_STATE:APPLICATION_PERIOD + 1]])
+                application_store.update(i, row)
+                return result
+    if i is not None:
+        await application_store.refresh(force=True)
+    if on_error is not None:
+        await on_error()
+    if i is None:
         raise BadArgument(f'application not found')
-    result[-1] = sheet['active_time_formula'].format(i + 2)
-    sheet_write(sheet['sheet_id'], sheet['insert_range'].format(i + 2), [result])
-    return result
+    raise BadArgument(f'application row {i + 2} changed on the sheet')
+
+
+class MemberListWriter:
+    """
+    Coalesces the member list edits made within ``window`` seconds into one batch update.
 
+    Each edit carries the row it was computed from. The edited rows are read again right before the batch, and an
+    edit whose row has changed since is not written, so that concurrent edits never clobber each other.
+    """
+
+    def __init__(self, window: float = MEMBER_LIST_WRITE_WINDOW):
+        self.window: float = window
+        self.pending: dict = dict()
+        self.flushing: Optional[asyncio.Task] = None
+
+    def schedule(self, i: int, expected: list, changes: dict) -> asyncio.Future:
+        """
+        Schedules ``changes``, a dict of column to value, on the ``i``-th row of the member list. The returned
+        future resolves to the written row, or to ``None`` if the row has changed since ``expected`` was read.
+        """
+        future = asyncio.get_event_loop().create_future()
+        if i in self.pending:
+            _, changes_, futures = self.pending[i]
+            changes_.update(changes)
+            futures.append(future)
+        else:
+            self.pending[i] = (expected, dict(changes), [future])
+        if self.flushing is None:
+            self.flushing = asyncio.get_event_loop().create_task(self.flush_later())
+        return future
+
+    async def flush_later(self):
+        await asyncio.sleep(self.window)
+        self.flushing = None
+        await self.flush()
+
+    async def flush(self):
+        pending, self.pending = self.pending, dict()
+        if not pending:
+            return
+        sheet = get_constant('member_list')
+        try:
+            ranges = [sheet['row_range'].format(i + 1) for i in pending]
+            currents = await sheet_batch_read_async(sheet['sheet_id'], ranges)
+            data = dict()
+            written = dict()
+            for range_name, current, (i, (expected, changes, _)) in zip(ranges, currents, pending.items()):
+                if pad_row(current[0] if current else list(), MEMBER_LIST_COLUMNS) \
+                        != pad_row(expected.copy(), MEMBER_LIST_COLUMNS):
+                    Log.error(f'member list row {i + 1} changed concurrently; edit not written: {changes}')
+                    continue
+                row = pad_row(expected.copy(), MEMBER_LIST_COLUMNS)
+                for column, value in changes.items():
+                    row[column] = value
+                data[range_name] = [row]
+                written[i] = row
+            if data:
+                await sheet_batch_write_async(sheet['sheet_id'], data)
+        except Exception as e:
+            for _, _, futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for i, (_, _, futures) in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(written.get(i))
 
-def add_member(member: Member, nickname=None, rows=None):
+
+member_list_writer = MemberListWriter()
+member_list_lock = asyncio.Lock()
+
+
+async def add_member(member: Member, nickname=None):
+    """
+    Appends ``member`` to the member list, reading only the number column to number the new row.
+
+    If another writer appended a row in the meantime, the new row lands below it and is renumbered after its
+    predecessor.
+    """
     sheet = get_constant('member_list')
-    if rows is None:
-        rows = sheet_read(sheet['sheet_id'], sheet['range'])
     if nickname is None:
-        nickname = get_nickname_of(member)
-    result = [int(rows[-1][0]) + 1, nickname, str(member.roles[-1]), str(member.id), str(to_kst(member.joined_at))]
-    rows.append(result.copy())
-    if result:
-        sheet_write(sheet['sheet_id'], sheet['range'], rows)
+        nickname = await get_nickname_of(member)
+    async with member_list_lock:
+        numbers = await sheet_read_async(sheet['sheet_id'], sheet['number_range'])
+        result = [int(numbers[-1][0]) + 1, nickname, str(member.roles[-1]), str(member.id),
+                  str(to_kst(member.joined_at))]
+        response = await sheet_append_async(sheet['sheet_id'], sheet['range'], [result])
+        if (row := int(MEMBER_LIST_ROW_REGEX.search(response['updates']['updatedRange']).group(1))) \
+                != len(numbers) + 1:
+            Log.error(f'member list was appended concurrently; renumbering row {row}')
+            numbers = await sheet_read_async(sheet['sheet_id'], sheet['number_range'])
+            result[MEMBER_LIST_NUMBER] = int(numbers[row - 2][0]) + 1
+            await sheet_write_async(sheet['sheet_id'], sheet['row_range'].format(row), [result])
     return result
 
 
-def edit_member(query: str, nickname: Optional[str] = None, state: Optional[str] = None, rows=None):
+async def edit_member(query: str, nickname: Optional[str] = None, state: Optional[str] = None):
+    """
+    Edits the first member list row containing ``query``, retrying from a fresh read if the row is changed by
+    someone else before the edit is written.
+    """
     sheet = get_constant('member_list')
-    if rows is None:
-        rows = sheet_read(sheet['sheet_id'], sheet['range'])
-    result = None
-    for row in rows:
-        if query in row:
-            if nickname is not None:
-                row[MEMBER_LIST_NICKNAME] = nickname
-            if state is not None:
-                row[MEMBER_LIST_STATE] = state
-            result = row.copy()
-            break
-    if result:
-        sheet_write(sheet['sheet_id'], sheet['range'], rows)
-    return result
+    changes = dict()
+    if nickname is not None:
+        changes[MEMBER_LIST_NICKNAME] = nickname
+    if state is not None:
+        changes[MEMBER_LIST_STATE] = state
+    for _ in range(MEMBER_LIST_RETRIES):
+        rows = await sheet_read_async(sheet['sheet_id'], sheet['range'])
+        for i, row in enumerate(rows):
+            if query in row:
+                break
+        else:
+            return None
+        if not changes:
+            return row.copy()
+        if (result := await member_list_writer.schedule(i, row, changes)) is not None:
+            return result
+    raise BadArgument(f'member list row of {query} keeps changing')
 
 
 def get_application_state_emoji(application: list):
@@ -165,7 +418,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     def __init__(self, client: Bot):
         super().__init__(client)
         self.client: Bot = client
-        self.regulation: Optional[FreshData] = None
+        self.regulation_cache: FreshCache = FreshCache(SECOND_PER_HOUR, stale_for=SECOND_PER_HOUR)
         self.deck_handler: DeckHandler = DeckHandler(client)
         self.shtelo_guild: Optional[Guild] = None
         self.partner_channel: Optional[TextChannel] = None
@@ -174,6 +427,12 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
         self.title_div_role: Optional[Role] = None
         self.deck_div_role: Optional[Role] = None
         self.partner_role: Optional[Role] = None
+        self.receiving: set = set()
+        self.refreshing: Optional[asyncio.Task] = None
+
+    def cog_unload(self):
+        if self.refreshing is not None:
+            self.refreshing.cancel()
 
     async def after_ready(self):
         self.shtelo_guild = self.client.get_guild(get_constant('shtelo_guild'))
@@ -183,18 +442,17 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
         self.title_div_role = self.shtelo_guild.get_role(get_constant('title_div_role'))
         self.deck_div_role = self.shtelo_guild.get_role(get_constant('deck_div_role'))
         self.partner_role = self.shtelo_guild.get_role(get_constant('partner_role'))
+        if self.refreshing is None:
+            self.refreshing = self.client.loop.create_task(application_store.refresh_periodically())
 
-    def fetch_regulation(self):
-        if self.regulation is None \
-                or self.regulation.data is None:
-            paragraphs = wrap_codeblock(doc_read(get_constant('regulation')['doc_id']), split_paragraph=True)
-            self.regulation = FreshData(paragraphs, SECOND_PER_HOUR)
-        else:
-            paragraphs = self.regulation.data
-        return paragraphs
+    async def fetch_regulation(self):
+        async def read_regulation():
+            return wrap_codeblock(await doc_read_async(get_constant('regulation')['doc_id']), split_paragraph=True)
 
-    async def receive_application(self, member: Member, remarks: str, on_error=None, keys=None, rows=None):
-        await update_application(member, APPLICATION_RECEIVED, remarks, on_error, keys, rows)
+        return await self.regulation_cache.get(get_constant('regulation')['doc_id'], read_regulation)
+
+    async def receive_application(self, member: Member, remarks: str, on_error=None):
+        await update_application(member, APPLICATION_RECEIVED, remarks, on_error)
         tasks = list()
         if self.tester_role not in member.roles:
             tasks.append(member.add_roles(self.tester_role))
@@ -207,15 +465,29 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
 
     @modules.CustomCog.listener(name='on_message')
     async def receive_automatically(self, message: Message):
+        if message.channel.id != get_constant('self_introduction_channel') or len(message.content) < 10 \
+                or message.author.id in self.receiving:
+            return
+        if not application_store.is_pending(message.author) \
+                and (message.author.bot or self.member_role in getattr(message.author, 'roles', ())):
+            return
+        self.receiving.add(message.author.id)
+        try:
+            if not application_store.is_pending(message.author):
+                await application_store.refresh_recent()
+                if not application_store.is_pending(message.author):
+                    return
+            await self.receive_pending(message)
+        finally:
+            self.receiving.discard(message.author.id)
+
+    async def receive_pending(self, message: Message):
         literal = literals('receive_automatically')
 
         async def failed():
             await self.partner_channel.send(literal['failed'] % message.author.mention)
 
-        if message.channel.id != get_constant('self_introduction_channel') or len(message.content) < 10:
-            return
-        keys, rows = get_application_sheet()
-        application = get_application_of(message.author, rows)
+        application = await get_application_of(message.author)
         if application is None or application[APPLICATION_STATE]:
             return
         trigger_member_name = application[APPLICATION_INVITER]
@@ -235,10 +507,10 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
         remark = str(message.author.id)
         if not application[APPLICATION_INVITER]:
             remark = literal['subaccount'] % (trigger_member.id, remark)
-        await self.receive_application(message.author, remark, None, keys, rows)
+        await self.receive_application(message.author, remark, failed)
         await message.add_reaction(CONFIRM_EMOJI)
         if application[APPLICATION_INVITER]:
-            add_member(message.author, application[APPLICATION_NICKNAME])
+            await add_member(message.author, application[APPLICATION_NICKNAME])
         await self.partner_channel.send(literal['done'] % (message.author.mention, message.jump_url),
                                         embed=get_application_embed(application))
 
@@ -248,7 +520,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
         literal = literals('applications')
         start_message = await ctx.author.send(literal['start'])
         message = None
-        _, replies = get_application_sheet()
+        await application_store.refresh()
         query = tuple(set(query))
         query_state = tuple(filter(lambda q: q in (APPLICATION_RECEIVED, APPLICATION_APPROVED),
                                    query))
@@ -259,9 +531,8 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
                 query_state = (APPLICATION_RECEIVED,)
             else:
                 query_state = (APPLICATION_RECEIVED, APPLICATION_APPROVED)
-        queried = list(filter(lambda r: (not r[APPLICATION_STATE] or r[APPLICATION_STATE] in query_state) and
-                                        (not query or tuple(filter(lambda q: q in str(r), query))),
-                              replies))
+        queried = list(filter(lambda r: not query or tuple(filter(lambda q: q in str(r), query)),
+                              application_store.get_by_state('', *query_state)))
         query_str = ', '.join(query + query_state)
         count = len(queried)
         states = list()
@@ -284,8 +555,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     async def application_receive(self, ctx: Context, member: Member, *, remarks: str = None):
         literal = literals('application_receive')
         message = await ctx.send(literal['start'])
-        keys, rows = get_application_sheet()
-        appilcation = get_application_of(member, rows)
+        appilcation = await get_application_of(member)
         if appilcation is None:
             await message.edit(content=literal['failed'] % str(member))
             return
@@ -330,7 +600,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     async def member_register(self, ctx: Context, member: Member):
         literal = literals('member')
         message = await ctx.send(literal['start'])
-        add_member(member)
+        await add_member(member)
         await message.edit(content=literal['done'])
 
     @member.group(name='수정', enabled=False)
@@ -345,7 +615,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     async def member_edit_nickname(self, ctx: Context, query: str, *, nickname: str):
         literal = literals('member')
         message = await ctx.send(literal['start'])
-        edit_member(query, nickname)
+        await edit_member(query, nickname)
         await message.edit(content=literal['done'])
 
     @member_edit.command(name='상태')
@@ -354,7 +624,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     async def member_edit_state(self, ctx: Context, query: str, *, state: str):
         literal = literals('member')
         message = await ctx.send(literal['start'])
-        edit_member(query, None, state)
+        await edit_member(query, None, state)
         await message.edit(content=literal['done'])
 
     # @applications.command(name='기각')
@@ -380,7 +650,7 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     async def regulation(self, ctx: Context, *, keyword: str = ''):
         literal = literals('regulation')
         message = await ctx.send(literal['start'])
-        paragraphs = self.fetch_regulation()
+        paragraphs = await self.fetch_regulation()
         await message.edit(content=literal['done'])
         if not keyword:
             await ctx.author.send(paragraphs[0])
@@ -399,9 +669,9 @@ class ShteloCog(CustomCog, name=get_cog('ShteloCog')['name']):
     async def regulation_all(self, ctx: Context):
         literal = literals('regulation_all')
         message = await ctx.send(literal['start'])
-        paragraphs = wrap_codeblock(doc_read(get_constant('regulation')['doc_id']), split_paragraph=True)
+        content = await doc_read_async(get_constant('regulation')['doc_id'])
         await message.edit(content=literal['done'])
-        for p in paragraphs:
+        for p in iter_codeblocks(content.split('\n'), split_paragraph=True):
             await ctx.author.send(p)
 
     @modules.command(name='회의록')
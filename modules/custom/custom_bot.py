@@ -1,12 +1,19 @@
-from asyncio import get_event_loop
-from os import listdir
+from asyncio import get_event_loop, sleep, gather
+from os import listdir, makedirs
+from os.path import dirname
+from time import perf_counter
 
 from decouple import config
 from discord import Intents
-from discord.ext.commands import ExtensionAlreadyLoaded, ExtensionFailed, NoEntryPointError, ExtensionError
+from discord.ext.commands import ExtensionAlreadyLoaded, ExtensionFailed, NoEntryPointError, ExtensionError, Context, \
+    CommandOnCooldown
 from discord.ext.commands.bot import Bot
 
-from utils import get_path, get_constant, Log, singleton
+from utils import get_path, get_constant, Log, singleton, watch_literals
+from .custom_profiler import StartupProfiler
+from .custom_stats import CommandStats
+
+STATS_DUMP_INTERVAL = 3600
 
 
 @singleton
@@ -15,8 +22,88 @@ class CustomBot(Bot):
         intents = Intents.default()
         intents.members = True
         super().__init__([get_constant('default_prefix')], intents=intents)
+        self.profiler: StartupProfiler = StartupProfiler() if 'p' in args else None
+        self.command_stats: CommandStats = CommandStats()
+        self.shutdown_hooks: list = list()
+        self.before_invoke(self.before_command)
+        self.after_invoke(self.after_command)
+        self.add_listener(self.record_command_error, 'on_command_error')
         self.load_all_extensions()
-        get_event_loop().run_until_complete(self.start(config('TOKEN') if 'b' not in args else config('BETA_TOKEN')))
+        self.loop.create_task(watch_literals())
+        self.loop.create_task(self.dump_command_stats())
+        if self.profiler is not None:
+            self.loop.create_task(self.report_startup())
+        try:
+            get_event_loop().run_until_complete(self.start(config('TOKEN') if 'b' not in args
+                                                           else config('BETA_TOKEN')))
+        except KeyboardInterrupt:
+            get_event_loop().run_until_complete(self.close())
+
+    def add_shutdown_hook(self, hook):
+        if hook not in self.shutdown_hooks:
+            self.shutdown_hooks.append(hook)
+
+    def remove_shutdown_hook(self, hook):
+        if hook in self.shutdown_hooks:
+            self.shutdown_hooks.remove(hook)
+
+    async def close(self):
+        Log.auto('closing...')
+        for result in await gather(*[hook() for hook in self.shutdown_hooks], return_exceptions=True):
+            if isinstance(result, Exception):
+                Log.error(result)
+        await super().close()
+
+    def _load_from_module_spec(self, spec, key):
+        if self.profiler is None:
+            return super()._load_from_module_spec(spec, key)
+        record = self.profiler.wrap_spec(spec, key)
+        start = perf_counter()
+        try:
+            super()._load_from_module_spec(spec, key)
+        finally:
+            self.profiler.end_extension(record, start)
+
+    async def report_startup(self):
+        await self.wait_until_ready()
+        self.profiler.mark_ready()
+        for line in self.profiler.to_lines():
+            Log.auto(line)
+        makedirs(dirname(path := get_path('startup_report')), exist_ok=True)
+        self.profiler.dump(path)
+
+    async def invoke(self, ctx: Context):
+        ctx.invoked_at = perf_counter()
+        await super().invoke(ctx)
+
+    async def before_command(self, ctx: Context):
+        ctx.prepared_at = perf_counter()
+
+    async def after_command(self, ctx: Context):
+        if getattr(ctx, 'stats_recorded', False):
+            return
+        ctx.stats_recorded = True
+        now = perf_counter()
+        invoked_at = getattr(ctx, 'invoked_at', now)
+        self.command_stats.record_invocation(ctx.command.qualified_name,
+                                             getattr(ctx, 'prepared_at', invoked_at) - invoked_at, now - invoked_at)
+
+    async def record_command_error(self, ctx: Context, error: Exception):
+        if ctx.command is None:
+            return
+        latency = None
+        if not getattr(ctx, 'stats_recorded', False) and hasattr(ctx, 'invoked_at'):
+            ctx.stats_recorded = True
+            latency = perf_counter() - ctx.invoked_at
+        self.command_stats.record_error(ctx.command.qualified_name, error, latency,
+                                        isinstance(error, CommandOnCooldown))
+
+    async def dump_command_stats(self):
+        while True:
+            await sleep(STATS_DUMP_INTERVAL)
+            if self.command_stats.records:
+                makedirs(dirname(path := get_path('command_stats')), exist_ok=True)
+                self.command_stats.dump(path)
 
     def load_all_extensions(self):
         for file_name in listdir(get_path('extensions')):
@@ -48,4 +135,4 @@ class CustomBot(Bot):
         done = True
         for extension in self.extensions.keys():
             done = done and self.reload_extension(extension)
-        return done
\ No newline at end of file
+        return done
@@ -0,0 +1,108 @@
+import asyncio
+import inspect
+from typing import Iterable, Optional
+
+from discord import HTTPException
+
+from utils import Log
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class BulkReport:
+    def __init__(self, total: int):
+        self.total: int = total
+        self.done: list = list()
+        self.failed: list = list()
+        self.retries: int = 0
+
+    @property
+    def finished(self) -> int:
+        return len(self.done) + len(self.failed)
+
+    @property
+    def failed_items(self) -> list:
+        return [item for item, _ in self.failed]
+
+
+class BulkExecutor:
+    """
+    Runs an operation on many items, at most ``concurrency`` at a time and at most one every ``interval`` seconds per
+    route, where ``route(item)`` groups the items that share a Discord rate limit bucket.
+
+    An item failing with a rate limit or server error is retried up to ``retries`` times with exponential backoff.
+    Other errors fail only that item, and the report lists what was done and what failed. ``progress(report)`` is
+    awaited at most once every ``progress_interval`` seconds while items finish, and once at the end.
+    """
+
+    def __init__(self, *, concurrency: int = 4, interval: float = 0.25, retries: int = 3, backoff: float = 1.0,
+                 route=None, progress=None, progress_interval: float = 2.0):
+        self.concurrency: int = concurrency
+        self.interval: float = interval
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.route = route
+        self.progress = progress
+        self.progress_interval: float = progress_interval
+        self.next_at: dict = dict()
+        self.progressed_at: float = 0
+        self.progress_task: Optional[asyncio.Task] = None
+
+    async def run(self, items: Iterable, operation) -> BulkReport:
+        items = list(items)
+        report = BulkReport(len(items))
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_(item):
+            async with semaphore:
+                await self.apply(item, operation, report)
+            self.report_progress(report)
+
+        await asyncio.gather(*[run_(item) for item in items])
+        if self.progress_task is not None:
+            await self.progress_task
+        if self.progress is not None:
+            await self.call_progress(report)
+        return report
+
+    async def pace(self, item):
+        loop = asyncio.get_event_loop()
+        key = self.route(item) if self.route is not None else None
+        start = max(loop.time(), self.next_at.get(key, 0))
+        self.next_at[key] = start + self.interval
+        if (delay := start - loop.time()) > 0:
+            await asyncio.sleep(delay)
+
+    async def apply(self, item, operation, report: BulkReport):
+        for attempt in range(self.retries + 1):
+            await self.pace(item)
+            try:
+                result = operation(item)
+                if inspect.isawaitable(result):
+                    await result
+            except HTTPException as e:
+                if e.status in RETRY_STATUSES and attempt < self.retries:
+                    report.retries += 1
+                    await asyncio.sleep(self.backoff * 2 ** attempt)
+                    continue
+                report.failed.append((item, e))
+            except Exception as e:
+                report.failed.append((item, e))
+            else:
+                report.done.append(item)
+            return
+
+    def report_progress(self, report: BulkReport):
+        if self.progress is None or report.finished == report.total \
+                or (self.progress_task is not None and not self.progress_task.done()):
+            return
+        if (now := asyncio.get_event_loop().time()) - self.progressed_at < self.progress_interval:
+            return
+        self.progressed_at = now
+        self.progress_task = asyncio.get_event_loop().create_task(self.call_progress(report))
+
+    async def call_progress(self, report: BulkReport):
+        try:
+            await self.progress(report)
+        except HTTPException as e:
+            Log.error(f'failed to report bulk progress: {e}')
@@ -1,9 +1,14 @@
 import discord
+from discord import NotFound, Forbidden
 from discord.ext.commands import GroupMixin, BucketType, Command, Group, Context, check
 
-from utils import get_brief, get_help, get_constant
+from utils import get_brief, get_help, get_constant, FreshCache
 from .custom_cooldowns import SharedCooldown, SharedCooldownMapping
 
+NOT_MEMBER_EXPIRE = 60
+
+not_members = FreshCache(NOT_MEMBER_EXPIRE, max_size=1024)  # users confirmed over REST to be out of the guild
+
 
 class CustomGroupMixin(GroupMixin):
     def __init__(self, *args, **kwargs):
@@ -156,11 +161,38 @@ def avoid_channels(channel_id: tuple or int):
     return check(predicate)
 
 
+async def get_cached_member(bot, guild_id: int, user_id: int):
+    """
+    Returns the member from the gateway cache, asking the REST API only on a cache miss.
+    Users the API reports as non-members are remembered for NOT_MEMBER_EXPIRE seconds.
+    """
+    guild = bot.get_guild(guild_id)
+    if guild is not None and (member := guild.get_member(user_id)) is not None:
+        return member
+    key = (guild_id, user_id)
+    if key in not_members:
+        return None
+    try:
+        if guild is None:
+            guild = await bot.fetch_guild(guild_id)
+        return await guild.fetch_member(user_id)
+    except (NotFound, Forbidden):
+        not_members.set(key, True)
+        return None
+
+
 def bot_need_permissions(**permissions):
-    def predicate(ctx: Context) -> bool:
-        client_permissions: dict = dict(ctx.guild.get_member(get_constant('kenken_id')).guild_permissions)
+    async def predicate(ctx: Context) -> bool:
+        if ctx.guild is None:
+            return False
+        me = ctx.guild.me
+        if me is None:
+            me = await get_cached_member(ctx.bot, ctx.guild.id, ctx.bot.user.id)
+        if me is None:
+            return False
+        client_permissions = me.guild_permissions
         for perm, value in permissions.items():
-            if client_permissions[perm] != value:
+            if getattr(client_permissions, perm) != value:
                 return False
         return True
 
@@ -171,11 +203,7 @@ def bot_need_permissions(**permissions):
 def partner_only():
     async def predicate(ctx: Context):
         partner_role_id = get_constant('partner_role')
-        shtelo_guild_id = get_constant('shtelo_guild')
-        guild = await ctx.bot.fetch_guild(shtelo_guild_id)
-        member = None
-        if guild is not None:
-            member = await guild.fetch_member(ctx.author.id)
+        member = await get_cached_member(ctx.bot, get_constant('shtelo_guild'), ctx.author.id)
         if member is None:
             return False
         role = discord.utils.get(member.roles, id=partner_role_id)
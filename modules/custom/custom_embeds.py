@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Iterable
 
 from discord import Embed, Colour
 from discord.embeds import EmptyEmbed
@@ -15,20 +15,67 @@ class ChainedEmbed(Embed):
         self.depth: int = depth
         self.color: Colour = color
         self.next: Optional[ChainedEmbed] = None
+        self.last: ChainedEmbed = self
+        self.fields_length: int = 0
+
+    def header_length(self) -> int:
+        length = len(self.title) + len(self.description)
+        if footer := getattr(self, '_footer', None):
+            length += len(footer.get('text', ''))
+        if author := getattr(self, '_author', None):
+            length += len(author.get('name', ''))
+        return length
+
+    def has_room_for(self, field_length: int) -> bool:
+        return len(getattr(self, '_fields', ())) < ChainedEmbed.MAX_FIELD \
+               and self.header_length() + self.fields_length + field_length <= ChainedEmbed.MAX_LEN
 
     def add_field(self, *, name, value, inline=False):
-        super().add_field(name=name, value=value, inline=inline)
-        if len(self.fields) > ChainedEmbed.MAX_FIELD or len(self) > ChainedEmbed.MAX_LEN:
-            self.remove_field(-1)
-            if self.next is None:
-                self.next = ChainedEmbed(title=self.title, color=self.color, footer=self.footer, depth=self.depth + 1)
-            self.next.add_field(name=name, value=value, inline=inline)
+        name, value = str(name), str(value)
+        field_length = len(name) + len(value)
+        tail = self.last
+        if not tail.has_room_for(field_length) and tail.fields_length:
+            tail.next = ChainedEmbed(title=self.title, color=self.color, footer=self.footer, depth=tail.depth + 1)
+            tail = self.last = tail.next
+        Embed.add_field(tail, name=name, value=value, inline=inline)
+        tail.fields_length += field_length
+
+    def add_fields(self, fields: Iterable, *, inline=False):
+        """
+        Adds (name, value) or (name, value, inline) pairs in order, chaining new embeds as they fill up.
+        """
+        for field in fields:
+            self.add_field(name=field[0], value=field[1], inline=field[2] if len(field) > 2 else inline)
+
+    def insert_field_at(self, index, *, name, value, inline=False):
+        super().insert_field_at(index, name=name, value=value, inline=inline)
+        self.fields_length += len(str(name)) + len(str(value))
+
+    def set_field_at(self, index, *, name, value, inline=False):
+        try:
+            field = self._fields[index]
+        except (AttributeError, IndexError):
+            raise IndexError('field index out of range')
+        old_length = len(field['name']) + len(field['value'])
+        super().set_field_at(index, name=name, value=value, inline=inline)
+        self.fields_length += len(str(name)) + len(str(value)) - old_length
+
+    def remove_field(self, index):
+        try:
+            field = self._fields[index]
+        except (AttributeError, IndexError):
+            return
+        super().remove_field(index)
+        self.fields_length -= len(field['name']) + len(field['value'])
+
+    def clear_fields(self):
+        super().clear_fields()
+        self.next = None
+        self.last = self
+        self.fields_length = 0
 
     def set_footer(self, *, text=EmptyEmbed, icon_url=EmptyEmbed):
-        if self.next is None:
-            super().set_footer(text=text, icon_url=icon_url)
-        else:
-            self.next.set_footer(text=text, icon_url=icon_url)
+        Embed.set_footer(self.last, text=text, icon_url=icon_url)
 
     def to_list(self):
         embed_list = list()
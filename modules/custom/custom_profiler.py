@@ -0,0 +1,58 @@
+import json
+from datetime import datetime
+from time import perf_counter
+
+
+class TimedLoader:
+    def __init__(self, loader, record: dict):
+        self.loader = loader
+        self.record = record
+
+    def __getattr__(self, item):
+        return getattr(self.loader, item)
+
+    def exec_module(self, module):
+        start = perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.record['import'] = perf_counter() - start
+
+
+class StartupProfiler:
+    """
+    Records how long every extension takes to import and set up, and how long the bot takes to become ready.
+    """
+
+    def __init__(self):
+        self.started_at: float = perf_counter()
+        self.extensions: dict = dict()
+        self.ready_after: float = None
+
+    def wrap_spec(self, spec, key: str):
+        record = self.extensions[key] = {'import': 0.0, 'setup': 0.0, 'total': 0.0}
+        spec.loader = TimedLoader(spec.loader, record)
+        return record
+
+    def end_extension(self, record: dict, start: float):
+        record['total'] = perf_counter() - start
+        record['setup'] = max(0.0, record['total'] - record['import'])
+
+    def mark_ready(self):
+        if self.ready_after is None:
+            self.ready_after = perf_counter() - self.started_at
+
+    def to_lines(self):
+        lines = list()
+        for key, record in sorted(self.extensions.items(), key=lambda item: item[1]['total'], reverse=True):
+            lines.append(f'{key}: total {record["total"]:.3f}s '
+                         f'(import {record["import"]:.3f}s, setup {record["setup"]:.3f}s)')
+        lines.append(f'extensions: {sum(record["total"] for record in self.extensions.values()):.3f}s')
+        if self.ready_after is not None:
+            lines.append(f'ready after: {self.ready_after:.3f}s')
+        return lines
+
+    def dump(self, path: str):
+        with open(path, mode='at', encoding='utf-8') as f:
+            f.write(json.dumps({'time': str(datetime.now()), 'extensions': self.extensions,
+                                'ready_after': self.ready_after}) + '\n')
@@ -0,0 +1,124 @@
+import json
+from datetime import datetime
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in microseconds, in the style of HDR histograms.
+
+    Every power of two is split into ``2 ** SUB_BUCKET_BITS`` linear buckets, so a percentile is reported with a
+    relative error of at most ``2 ** -SUB_BUCKET_BITS`` in constant memory per bucket used.
+    """
+    SUB_BUCKET_BITS = 4
+
+    def __init__(self):
+        self.buckets: dict = dict()
+        self.count: int = 0
+        self.sum: int = 0
+        self.max: int = 0
+
+    @classmethod
+    def index_of(cls, value: int) -> int:
+        if value < 1 << cls.SUB_BUCKET_BITS:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return ((shift + 1) << cls.SUB_BUCKET_BITS) + (value >> shift) - (1 << cls.SUB_BUCKET_BITS)
+
+    @classmethod
+    def value_of(cls, index: int) -> int:
+        if index < 1 << cls.SUB_BUCKET_BITS:
+            return index
+        shift = (index >> cls.SUB_BUCKET_BITS) - 1
+        top = (index & ((1 << cls.SUB_BUCKET_BITS) - 1)) + (1 << cls.SUB_BUCKET_BITS)
+        return ((top + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        value = max(0, int(seconds * 1_000_000))
+        index = self.index_of(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the latency in milliseconds below which ``percent`` percent of the records fall.
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.value_of(index), self.max) / 1000
+        return self.max / 1000
+
+    def to_dict(self):
+        return {'count': self.count, 'sum': self.sum, 'max': self.max,
+                'buckets': {str(index): count for index, count in sorted(self.buckets.items())}}
+
+
+class CommandRecord:
+    def __init__(self):
+        self.invocations: int = 0
+        self.errors: dict = dict()
+        self.cooldowns: int = 0
+        self.latency: LatencyHistogram = LatencyHistogram()
+        self.preparation: LatencyHistogram = LatencyHistogram()
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.invocations if self.invocations else 0.0
+
+    def to_dict(self):
+        return {'invocations': self.invocations, 'errors': self.errors, 'cooldowns': self.cooldowns,
+                'latency': self.latency.to_dict(), 'preparation': self.preparation.to_dict()}
+
+
+class CommandStats:
+    """
+    Per-command invocation counts, latencies, errors and cooldown rejections keyed by qualified name.
+
+    ``preparation`` measures the time spent on checks, converters and cooldowns before the callback runs and
+    ``latency`` the whole invocation.
+    """
+
+    def __init__(self):
+        self.started_at: datetime = datetime.now()
+        self.records: dict = dict()
+
+    def get(self, name: str) -> CommandRecord:
+        if (record := self.records.get(name)) is None:
+            record = self.records[name] = CommandRecord()
+        return record
+
+    def record_invocation(self, name: str, preparation: float, latency: float):
+        record = self.get(name)
+        record.invocations += 1
+        record.preparation.record(preparation)
+        record.latency.record(latency)
+
+    def record_error(self, name: str, error: Exception, latency: float = None, cooldown: bool = False):
+        record = self.get(name)
+        if cooldown:
+            record.cooldowns += 1
+            return
+        error_name = type(error).__name__
+        record.errors[error_name] = record.errors.get(error_name, 0) + 1
+        if latency is not None:
+            record.invocations += 1
+            record.latency.record(latency)
+
+    def sorted_records(self):
+        return sorted(self.records.items(), key=lambda item: item[1].invocations, reverse=True)
+
+    def dump(self, path: str):
+        with open(path, mode='at', encoding='utf-8') as f:
+            f.write(json.dumps({'time': str(datetime.now()), 'since': str(self.started_at),
+                                'commands': {name: record.to_dict() for name, record in self.records.items()}},
+                               ensure_ascii=False) + '\n')
@@ -1,2 +1,4 @@
 from .docs import *
 from .spreadsheets import *
+from .google_executor import run_google_api, sheet_read_async, sheet_write_async, sheet_append_async, \
+    sheet_batch_read_async, sheet_batch_write_async, doc_read_async, google_api_stats
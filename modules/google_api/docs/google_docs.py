@@ -1,10 +1,6 @@
 from __future__ import print_function
 
-from apiclient import discovery
-from httplib2 import Http
-from oauth2client import client
-from oauth2client import file
-from oauth2client import tools
+import threading
 
 from utils import get_path
 
@@ -12,6 +8,7 @@ SCOPES = 'https://www.googleapis.com/auth/documents.readonly'
 DISCOVERY_DOC = 'https://docs.googleapis.com/$discovery/rest?version=v1'
 
 list_order = dict()
+list_order_lock = threading.Lock()
 
 
 def get_prefix_of(list_id, nested):
@@ -24,6 +21,8 @@ def get_prefix_of(list_id, nested):
 
 
 def get_credentials():
+    from oauth2client import client, file, tools  # deferred so that importing modules stays cheap
+
     store = file.Storage(get_path('docs_token'))
     credentials = store.get()
 
@@ -94,15 +93,19 @@ def read_strucutural_elements(elements):
 
 
 def doc_read(doc_id):
+    from apiclient import discovery
+    from httplib2 import Http
+
     credentials = get_credentials()
     http = credentials.authorize(Http())
     docs_service = discovery.build('docs', 'v1', http=http, discoveryServiceUrl=DISCOVERY_DOC)
     doc = docs_service.documents().get(documentId=doc_id).execute()
     doc_content = doc.get('body').get('content')
-    result = read_strucutural_elements(doc_content)
+    with list_order_lock:
+        result = read_strucutural_elements(doc_content)
+        list_order.clear()
     # with open('./test.json', mode='w', encoding='utf-8') as f:
     #     json.dump(doc_content, f, indent=4, ensure_ascii=False)
     # with open('./stringified.txt', mode='w', encoding='utf-8') as f:
     #     f.write(result)
-    list_order.clear()
     return result
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from utils import Log
+from .docs import doc_read
+from .spreadsheets import sheet_read, sheet_write, sheet_append, sheet_batch_read, sheet_batch_write
+
+MAX_WORKERS = 4
+DEFAULT_TIMEOUT = 60
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='google_api')
+_lock = threading.Lock()
+
+google_api_stats = {'queued': 0, 'running': 0, 'max_queued': 0, 'calls': 0, 'errors': 0, 'timeouts': 0,
+                    'cancelled': 0}
+
+
+def _submit(function, *args, **kwargs) -> Future:
+    with _lock:
+        google_api_stats['queued'] += 1
+        google_api_stats['max_queued'] = max(google_api_stats['max_queued'], google_api_stats['queued'])
+
+    def call():
+        with _lock:
+            google_api_stats['queued'] -= 1
+            google_api_stats['running'] += 1
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            with _lock:
+                google_api_stats['errors'] += 1
+            raise
+        finally:
+            with _lock:
+                google_api_stats['running'] -= 1
+                google_api_stats['calls'] += 1
+
+    def cancelled(future_: Future):
+        if future_.cancelled():
+            with _lock:
+                google_api_stats['queued'] -= 1
+                google_api_stats['cancelled'] += 1
+
+    future = _executor.submit(call)
+    future.add_done_callback(cancelled)
+    return future
+
+
+async def run_google_api(function, *args, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+    """
+    Runs a blocking Google API call on the Google API thread pool and waits for it at most ``timeout`` seconds.
+
+    Cancelling the waiting coroutine, or timing out, drops a call that has not started yet. A call already running
+    finishes in its thread and its result is discarded.
+    """
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(_submit(function, *args, **kwargs)), timeout)
+    except asyncio.TimeoutError:
+        with _lock:
+            google_api_stats['timeouts'] += 1
+        Log.error(f'google api call timed out after {timeout}s: {function.__name__}')
+        raise
+
+
+async def sheet_read_async(spreadsheet_id, range_name, *, timeout: float = DEFAULT_TIMEOUT):
+    return await run_google_api(sheet_read, spreadsheet_id, range_name, timeout=timeout)
+
+
+async def sheet_write_async(spreadsheet_id, range_name, values, value_iput_option='USER_ENTERED', *,
+                            timeout: float = DEFAULT_TIMEOUT):
+    return await run_google_api(sheet_write, spreadsheet_id, range_name, values, value_iput_option, timeout=timeout)
+
+
+async def sheet_append_async(spreadsheet_id, range_name, values, value_iput_option='USER_ENTERED', *,
+                             timeout: float = DEFAULT_TIMEOUT):
+    return await run_google_api(sheet_append, spreadsheet_id, range_name, values, value_iput_option, timeout=timeout)
+
+
+async def sheet_batch_read_async(spreadsheet_id, range_names, *, timeout: float = DEFAULT_TIMEOUT):
+    return await run_google_api(sheet_batch_read, spreadsheet_id, range_names, timeout=timeout)
+
+
+async def sheet_batch_write_async(spreadsheet_id, data: dict, value_iput_option='USER_ENTERED', *,
+                                  timeout: float = DEFAULT_TIMEOUT):
+    return await run_google_api(sheet_batch_write, spreadsheet_id, data, value_iput_option, timeout=timeout)
+
+
+async def doc_read_async(doc_id, *, timeout: float = DEFAULT_TIMEOUT):
+    return await run_google_api(doc_read, doc_id, timeout=timeout)
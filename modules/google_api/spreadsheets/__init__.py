@@ -1 +1 @@
-from .google_sheets import sheet_read, sheet_write
+from .google_sheets import sheet_read, sheet_write, sheet_append, sheet_batch_read, sheet_batch_write
@@ -2,32 +2,98 @@ from __future__ import print_function
 
 import os.path
 import pickle
+import threading
+from datetime import datetime, timedelta
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-
-from utils import get_path
+from utils import get_path, Log
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
+REFRESH_MARGIN = timedelta(minutes=5)
 
+_lock = threading.Lock()
+_local = threading.local()
+_credentials = None
+_token = None
+_refresh_timer = None
 
-def get_service():
+
+def load_credentials():
+    from google_auth_oauthlib.flow import InstalledAppFlow  # deferred so that importing modules stays cheap
+
+    global _token
     creds = None
     token_path = get_path('spreadsheets_token')
     if os.path.exists(token_path):
         with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            credentials_path = get_path('spreadsheets_credentials')
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
-    service = build('sheets', 'v4', credentials=creds)
+            _token = token.read()
+        creds = pickle.loads(_token)
+    if not creds or not (creds.valid or creds.refresh_token):
+        credentials_path = get_path('spreadsheets_credentials')
+        flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
+        creds = flow.run_local_server(port=0)
+        save_token(creds)
+    return creds
+
+
+def save_token(creds):
+    global _token
+    if (token := pickle.dumps(creds)) != _token:
+        with open(get_path('spreadsheets_token'), 'wb') as f:
+            f.write(token)
+        _token = token
+
+
+def refresh_credentials():
+    """
+    Refreshes the shared credentials if they expire within ``REFRESH_MARGIN``, and schedules the next refresh before
+    the new expiry so that calls rarely wait for one.
+    """
+    from google.auth.transport.requests import Request
+
+    global _refresh_timer
+    with _lock:
+        if not _credentials.valid \
+                or (_credentials.expiry is not None and _credentials.expiry - datetime.utcnow() < REFRESH_MARGIN):
+            _credentials.refresh(Request())
+            save_token(_credentials)
+            Log.auto('spreadsheets credentials refreshed')
+        if _credentials.expiry is not None and (_refresh_timer is None or not _refresh_timer.is_alive()):
+            delay = (_credentials.expiry - datetime.utcnow() - REFRESH_MARGIN).total_seconds()
+            _refresh_timer = threading.Timer(max(delay, 0) + 1, refresh_in_background)
+            _refresh_timer.daemon = True
+            _refresh_timer.start()
+
+
+def refresh_in_background():
+    global _refresh_timer
+    _refresh_timer = None
+    try:
+        refresh_credentials()
+    except Exception as e:
+        Log.error(f'failed to refresh spreadsheets credentials: {e}')
+
+
+def get_credentials():
+    global _credentials
+    with _lock:
+        if _credentials is None:
+            _credentials = load_credentials()
+    if not _credentials.valid or _refresh_timer is None:
+        refresh_credentials()
+    return _credentials
+
+
+def get_service():
+    """
+    Returns the Sheets service of the calling thread, built once and kept alive with its own HTTP connection.
+
+    The services of every thread share one set of credentials.
+    """
+    from googleapiclient.discovery import build
+
+    credentials = get_credentials()
+    if (service := getattr(_local, 'service', None)) is None:
+        service = _local.service = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
     return service
 
 
@@ -44,3 +110,28 @@ def sheet_write(spreadsheet_id, range_name, values, value_iput_option='USER_ENTE
                                                           valueInputOption=value_iput_option,
                                                           body={'values': values}).execute()
     return result
+
+
+def sheet_append(spreadsheet_id, range_name, values, value_iput_option='USER_ENTERED'):
+    result = get_service().spreadsheets().values().append(spreadsheetId=spreadsheet_id,
+                                                          range=range_name,
+                                                          valueInputOption=value_iput_option,
+                                                          insertDataOption='INSERT_ROWS',
+                                                          body={'values': values}).execute()
+    return result
+
+
+def sheet_batch_read(spreadsheet_id, range_names):
+    result = get_service().spreadsheets().values().batchGet(spreadsheetId=spreadsheet_id,
+                                                            ranges=range_names).execute()
+    return [value_range.get('values', list()) for value_range in result.get('valueRanges', list())]
+
+
+def sheet_batch_write(spreadsheet_id, data: dict, value_iput_option='USER_ENTERED'):
+    """
+    Writes every ``range_name: values`` item of ``data`` in one request.
+    """
+    body = {'valueInputOption': value_iput_option,
+            'data': [{'range': range_name, 'values': values} for range_name, values in data.items()]}
+    result = get_service().spreadsheets().values().batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
+    return result
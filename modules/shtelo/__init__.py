@@ -1,2 +1,3 @@
 from .bot_protocol import BotProtocol, Request
 from .deck import Deck, DeckHandler, DeckConverter
+from .deck_registry import DeckRegistry
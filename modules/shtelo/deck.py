@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import re
 from random import choice
-from re import match, sub
+from re import match
+from time import perf_counter
 from typing import Optional, Union
 
 import discord
@@ -10,24 +12,27 @@ from discord import Guild, Client, TextChannel, CategoryChannel, VoiceChannel, M
     NotFound
 from discord.abc import GuildChannel
 from discord.ext.commands import Converter, Context, TextChannelConverter, BadArgument, \
-    VoiceChannelConverter, CategoryChannelConverter, CommandError
+    VoiceChannelConverter, CategoryChannelConverter
 
-from utils import singleton, get_constant
+from modules.custom import BulkExecutor, BulkReport
+from utils import singleton, get_constant, get_path, Log
+from . import deck_topic, deck_snapshot
+from .deck_registry import DeckRegistry
+from .deck_writer import DeckTopicWriter
 
 
-def mention_to_id(mention: str) -> int:
-    return int(sub('[<>@!#]', '', mention))
+CHANNEL_ID_REGEX = re.compile('^<?#?(\\d{15,21})>?$')
 
 
 class Deck:
-    PUBLIC_EMOJI = ':white_check_mark:'
-    NSFW_EMOJI = ':underage:'
-    AUTO_EMOJI = ':robot:'
-    LOCK_EMOJI = ':lock:'
+    PUBLIC_EMOJI = deck_topic.PUBLIC_EMOJI
+    NSFW_EMOJI = deck_topic.NSFW_EMOJI
+    AUTO_EMOJI = deck_topic.AUTO_EMOJI
+    LOCK_EMOJI = deck_topic.LOCK_EMOJI
     PENDING_EMOJI = ':raised_hand:'
 
-    MANAGER = '매니저'
-    PENDING = '가입신청자'
+    MANAGER = deck_topic.MANAGER
+    PENDING = deck_topic.PENDING
 
     VALID_ID = '0123456789_acdefghijkmnprstvwxyzACEFGHJKLMNPRTVWXY'
 
@@ -57,23 +62,14 @@ class Deck:
                f'manager={self.manager} pending={self.pending} name={self.name} topic={self.topic} ' \
                f'category_channel={self.category_channel} default_channel={self.default_channel} role={self.role}>'
 
+    def to_deck_topic(self) -> deck_topic.DeckTopic:
+        return deck_topic.DeckTopic(id=self.id,
+                                    settings=deck_topic.settings_of(self.public, self.nsfw, self.auto, self.lock),
+                                    manager_id=self.manager.id, pending_ids=tuple(member.id for member in self.pending),
+                                    topic=self.topic[:self.TOPIC_MAX_LENGTH])
+
     def to_channel_topic(self):
-        deck_str = '*id: ' + self.id
-        setting = list()
-        if self.public:
-            setting.append(self.PUBLIC_EMOJI)
-        if self.nsfw:
-            setting.append(self.NSFW_EMOJI)
-        if self.auto:
-            setting.append(self.AUTO_EMOJI)
-        if self.lock:
-            setting.append(self.LOCK_EMOJI)
-        deck_str += ('\n' + ' '.join(setting) if setting else '')
-        deck_str += '\n' + self.MANAGER + ': ' + self.manager.mention
-        deck_str += ('\n' + self.PENDING + ': ' + ' '.join([member.mention for member in self.pending])
-                     if self.pending else '')
-        deck_str += '\n\n' + self.topic[:self.TOPIC_MAX_LENGTH]
-        return deck_str
+        return deck_topic.serialize(self.to_deck_topic())
 
     def get_brief(self):
         return '' \
@@ -90,114 +86,318 @@ class Deck:
 @singleton
 class DeckHandler:
     UPDATE_DELAY = 300
+    RECONCILE_INTERVAL = 3600
+    TOPIC_EDIT_INTERVAL = 300
+    FETCH_CONCURRENCY = 4
 
     RECYCLE_BIN_CATEGORY = 757466502202130512
     MANAGER_ROLE = 650534578880118820
     SHTELO_GUILD = 650533223520010261
 
-    MENTION_REGEX = '<@!?\\d+>'
-    ID_REGEX = '\\*id: [a-zA-Z0-9]{4,}'
-    SETTING_REGEX = '({0}|{1}|{2}|{3})( ({0}|{1}|{2}|{3}))*'\
-        .format(Deck.PUBLIC_EMOJI, Deck.NSFW_EMOJI, Deck.AUTO_EMOJI, Deck.LOCK_EMOJI)
-    MANAGER_REGEX = '매니저: {0}'.format(MENTION_REGEX)
-    PENDING_REGEX = '가입신청자:( {0})+'.format(MENTION_REGEX)
-    TOPIC_REGEX = '(.|\\n)+'
-    ENTIRE_REGEX = '^{0}(\\n{1})?\\n{2}(\\n{3})?(\\n{4})?$' \
-        .format(ID_REGEX, SETTING_REGEX, MANAGER_REGEX, PENDING_REGEX, TOPIC_REGEX)
-
     VALID_ID_REGEX = '^[0123456789_acdefghijkmnprstvwxyzACEFGHJKLMNPRTVWXY]{4}$'
 
     def __init__(self, client: Client):
         self.client: Client = client
         self.guild: Optional[Guild] = None
         self.manager_role: Optional[Role] = None
-        self.decks: Optional[dict] = None
-        self.ready: bool = False
+        self.decks: DeckRegistry = DeckRegistry()
+        self.role_members: dict = dict()
+        self.ready_event: asyncio.Event = asyncio.Event()
+        self.version: int = 0
+        self.refreshing: Optional[asyncio.Task] = None
         self.recycle_bin: Optional[CategoryChannel] = None
-        self.changes: list = list()
+        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(get_constant('deck_fetch_concurrency')
+                                                              or self.FETCH_CONCURRENCY)
+        self.request_count: int = 0
+        self.last_refresh: Optional[dict] = None
+        self.missing_decks: list = list()
+        self.unfinished_removals: dict = dict()
+        self.writer: DeckTopicWriter = DeckTopicWriter(client.loop, self._request, delay=self.UPDATE_DELAY,
+                                                       min_interval=self.TOPIC_EDIT_INTERVAL)
         client.loop.create_task(self._fetch_all())
 
     async def _fetch_all(self):
         await self.client.wait_until_ready()
-        self.guild = await self.client.fetch_guild(self.SHTELO_GUILD)
-        await self._fetch_decks()
-        self.recycle_bin = await self.client.fetch_channel(self.RECYCLE_BIN_CATEGORY)
-        self.manager_role = discord.utils.get(await self.guild.fetch_roles(), id=self.MANAGER_ROLE)
-        self.ready = True
+        self.guild = self.client.get_guild(self.SHTELO_GUILD)
+        if self.guild is None:
+            self.guild = await self.client.fetch_guild(self.SHTELO_GUILD)
+        elif self._load_snapshot():
+            self.ready_event.set()
+        await self.fetch_decks()
+        self.ready_event.set()
+        self.client.loop.create_task(self.reconcile_periodically())
+
+    def _load_snapshot(self) -> bool:
+        """
+        Builds the decks saved by the last run from the member and channel cache, so that deck commands are served
+        before the first refresh. Decks whose channels or manager have disappeared are kept in ``missing_decks``.
+        """
+        if not (records := deck_snapshot.load(get_path('deck_snapshot'))):
+            return False
+        decks = list()
+        missing = list()
+        for record in records:
+            category_channel = self.guild.get_channel(record['category_id'])
+            default_channel = self.guild.get_channel(record['default_channel_id'])
+            manager = self.guild.get_member(record['manager_id'])
+            if category_channel is None or default_channel is None or manager is None:
+                missing.append(record)
+                continue
+            decks.append(Deck(settings=record['settings'], default_channel=default_channel,
+                              category_channel=category_channel, topic=record['topic'], id=record['id'],
+                              pending=[member for member_id in record['pending_ids']
+                                       if (member := self.guild.get_member(member_id)) is not None],
+                              manager=manager, name=record['name'], role=self.guild.get_role(record['role_id'] or 0)))
+        self.recycle_bin = self.guild.get_channel(self.RECYCLE_BIN_CATEGORY)
+        self.manager_role = self.guild.get_role(self.MANAGER_ROLE)
+        self.missing_decks = missing
+        self._swap(DeckRegistry(decks))
+        Log.auto(f'decks loaded from snapshot: {len(decks)} decks, {len(missing)} missing')
+        if missing:
+            Log.auto('decks with missing channels or manager: '
+                     + ', '.join(f'{record["name"]} ({record["id"]})' for record in missing))
+        return True
+
+    def save_snapshot(self):
+        try:
+            deck_snapshot.dump(self.decks.values(), get_path('deck_snapshot'))
+        except OSError as e:
+            Log.error(f'failed to save deck snapshot: {e}')
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_event.is_set()
+
+    async def _request(self, coro):
+        async with self.semaphore:
+            self.request_count += 1
+            return await coro
+
+    async def _get_member(self, member_id: int) -> Optional[Member]:
+        if (member := self.guild.get_member(member_id)) is not None:
+            return member
+        try:
+            return await self._request(self.guild.fetch_member(member_id))
+        except NotFound:
+            return None
+
+    async def _fetch_snapshots(self):
+        channels, roles = await asyncio.gather(self._request(self.guild.fetch_channels()),
+                                               self._request(self.guild.fetch_roles()))
+        channels_by_id = {channel.id: channel for channel in channels}
+        roles_by_name = dict()
+        for role in roles:
+            roles_by_name.setdefault(role.name, role)
+        self.recycle_bin = channels_by_id.get(self.RECYCLE_BIN_CATEGORY, self.recycle_bin)
+        self.manager_role = discord.utils.get(roles, id=self.MANAGER_ROLE) or self.manager_role
+        return channels_by_id, roles_by_name
 
     async def wait_until_ready(self):
-        while not self.ready:
-            await asyncio.sleep(0.1)
+        await self.ready_event.wait()
 
     async def fetch_decks(self):
-        self.ready = False
-        await self._fetch_decks()
-        self.ready = True
+        """
+        Refetches every deck. The current snapshot keeps being served until the new one is complete, and concurrent
+        calls share one refresh.
+        """
+        if self.refreshing is None or self.refreshing.done():
+            self.refreshing = self.client.loop.create_task(self._fetch_decks())
+        await asyncio.shield(self.refreshing)
+
+    def _swap(self, decks: DeckRegistry):
+        for category_id, deck in list(self.unfinished_removals.items()):
+            if self.guild.get_channel(category_id) is None:
+                del self.unfinished_removals[category_id]
+            else:
+                decks[category_id] = deck
+        for category_id, entry in self.writer.pending.items():
+            if category_id in decks:
+                decks[category_id] = entry.deck
+        self.decks = decks
+        self.version += 1
+        self._index_members()
 
     async def _fetch_decks(self):
-        self.decks = dict()
-        tasks = list()
-        for channel in await self.guild.fetch_channels():
-            if isinstance(channel, TextChannel) \
-                    and channel.category_id is not None \
-                    and channel.category_id != self.RECYCLE_BIN_CATEGORY \
-                    and channel.topic is not None \
-                    and match(self.ENTIRE_REGEX, channel.topic) is not None:
-                tasks.append(self._fetch_deck(channel))
-        if tasks:
-            await asyncio.wait(tasks)
-
-    async def fetch_deck(self, default_channel: TextChannel):
-        self.ready = False
-        await self._fetch_deck(default_channel)
-        self.ready = True
-
-    async def _fetch_deck(self, default_channel: TextChannel):
-        if (category_id := default_channel.category_id) in self.decks:
-            del self.decks[category_id]
-        category_channel = await self.client.fetch_channel(category_id)
-        deck_name = category_channel.name
-        deck_role = discord.utils.get(await self.guild.fetch_roles(), name=deck_name)
-        raw = default_channel.topic
-        deck_id = match('^' + self.ID_REGEX, raw).group()[5:]
-        raw = raw.split('\n', 1)[-1]
-        if deck_settings := match('^' + self.SETTING_REGEX, raw):
-            deck_settings = deck_settings.group().split()
-            raw = raw.split('\n', 1)[-1]
+        start = perf_counter()
+        self.request_count = 0
+        channels_by_id, roles_by_name = await self._fetch_snapshots()
+        decks = await asyncio.gather(*[self._parse_deck(channel, channels_by_id, roles_by_name, header)
+                                       for channel in channels_by_id.values()
+                                       if isinstance(channel, TextChannel)
+                                       and channel.category_id is not None
+                                       and channel.category_id != self.RECYCLE_BIN_CATEGORY
+                                       and (header := deck_topic.parse(channel.topic)) is not None])
+        self._swap(DeckRegistry(deck for deck in decks if deck is not None))
+        self.missing_decks = list()
+        self.save_snapshot()
+        self.last_refresh = {'version': self.version, 'decks': len(self.decks), 'requests': self.request_count,
+                             'duration': perf_counter() - start}
+        Log.auto('decks fetched: version {version}, {decks} decks, {requests} requests, {duration:.3f}s'
+                 .format(**self.last_refresh))
+
+    async def _parse_deck(self, default_channel: TextChannel, channels_by_id: dict, roles_by_name: dict,
+                          header: deck_topic.DeckTopic = None) -> Optional[Deck]:
+        if header is None and (header := deck_topic.parse(default_channel.topic)) is None:
+            return
+        if (category_channel := channels_by_id.get(default_channel.category_id)) is None:
+            return
+        if (deck_manager := await self._get_member(header.manager_id)) is None:
+            return
+        deck_pending = [member for member in await asyncio.gather(*[self._get_member(member_id)
+                                                                    for member_id in header.pending_ids])
+                        if member is not None]
+        deck = Deck(settings=header.settings, default_channel=default_channel, category_channel=category_channel,
+                    pending=deck_pending, topic=header.topic, id=header.id, manager=deck_manager,
+                    name=category_channel.name, role=roles_by_name.get(category_channel.name))
+        return deck
+
+    def is_deck_channel(self, channel: GuildChannel) -> bool:
+        return isinstance(channel, TextChannel) and channel.category_id is not None \
+            and channel.category_id != self.RECYCLE_BIN_CATEGORY and deck_topic.parse(channel.topic) is not None
+
+    async def _reparse(self, default_channel: TextChannel):
+        """
+        Re-parses one deck from the channel cache, keeping the deck as it is while a topic write of it is pending.
+        """
+        if (category_id := default_channel.category_id) in self.writer.pending:
+            return
+        category_channel = self.guild.get_channel(category_id)
+        roles_by_name = dict()
+        if category_channel is not None and (role := discord.utils.get(self.guild.roles,
+                                                                        name=category_channel.name)) is not None:
+            roles_by_name[role.name] = role
+        deck = await self._parse_deck(default_channel, {category_id: category_channel} if category_channel else {},
+                                      roles_by_name)
+        if deck is not None:
+            self.decks[category_id] = deck
         else:
-            deck_settings = tuple()
-        try:
-            deck_manager = await self.guild.fetch_member(mention_to_id(match('^' + self.MANAGER_REGEX, raw).group()[5:]))
-        except NotFound:
+            self.decks.remove(category_id)
+        self.version += 1
+
+    async def reconcile_channel(self, before: Optional[GuildChannel], after: GuildChannel):
+        """
+        Applies a created or updated channel to the deck it belongs to, or belonged to, without refetching.
+        """
+        if not self.ready or self.guild is None or after.guild.id != self.guild.id:
+            return
+        if isinstance(after, CategoryChannel):
+            if (deck := self.decks.get(after.id)) is not None \
+                    and (default_channel := self.guild.get_channel(deck.default_channel.id)) is not None:
+                await self._reparse(default_channel)
+            return
+        if isinstance(after, TextChannel) and before is not None and before.category_id == after.category_id \
+                and before.topic != after.topic and after.topic == self.writer.last_written(after.id):
             return
-        if '\n' in raw:
-            raw = raw.split('\n', 1)[-1]
-        deck_pending = list()
-        if pending := match('^' + self.PENDING_REGEX, raw):
-
-            async def append_after_fetch(member_id):
-                deck_pending.append(await self.guild.fetch_member(member_id))
-
-            await asyncio.wait([append_after_fetch(mention_to_id(member)) for member in pending.group()[8:].split()])
-            if '\n' in raw:
-                raw = raw.split('\n', 1)[-1]
-        deck_topic = raw.split('\n', 1)[-1] if '\n' in raw else ''
-        deck = Deck(settings=deck_settings, default_channel=default_channel, category_channel=category_channel,
-                    pending=deck_pending, topic=deck_topic, id=deck_id, manager=deck_manager, name=deck_name,
-                    role=deck_role)
-        self.decks[category_id] = deck
+        old = self.decks.get_by_channel_id(after.id)
+        if self.is_deck_channel(after) and (old is None or old.default_channel.id == after.id):
+            if old is not None and old.category_channel.id != after.category_id:
+                self.decks.remove(old.category_channel.id)
+            await self._reparse(after)
+        elif old is not None and old.default_channel.id == after.id:
+            self.decks.remove(old.category_channel.id)
+            self.version += 1
+        else:
+            for deck in (old, self.decks.get(after.category_id)):
+                if deck is not None:
+                    self.decks.add(deck)
+
+    def forget_channel(self, channel: GuildChannel):
+        if self.guild is None or channel.guild.id != self.guild.id:
+            return
+        if (deck := self.decks.get_by_channel_id(channel.id)) is None:
+            return
+        if channel.id in (deck.category_channel.id, deck.default_channel.id):
+            self.decks.remove(deck.category_channel.id)
+            self.version += 1
+        else:
+            self.decks.add(deck)
+
+    def reconcile_role(self, before: Optional[Role], after: Optional[Role]):
+        """
+        Applies a created (``before`` is None), updated or deleted (``after`` is None) role to the deck using it.
+        """
+        if self.guild is None or (role := after or before).guild.id != self.guild.id:
+            return
+        if after is None:
+            if (deck := self.decks.get_by_role_id(before.id)) is not None:
+                deck.role = None
+                self.decks.add(deck)
+            self.role_members.pop(before.id, None)
+        elif (deck := self.decks.get_by_role_id(role.id)) is not None:
+            deck.role = role
+        elif (deck := self.decks.get_by_name(role.name)) is not None and deck.role is None:
+            deck.role = role
+            self.decks.add(deck)
+
+    async def reconcile_periodically(self):
+        while True:
+            await asyncio.sleep(self.RECONCILE_INTERVAL)
+            old = self.decks
+            try:
+                await self.fetch_decks()
+            except Exception as e:
+                Log.error(f'failed to reconcile decks: {e}')
+                continue
+            if diff := self.diff(old, self.decks):
+                Log.auto(f'deck reconciliation found {len(diff)} missed changes: {diff}')
+
+    @staticmethod
+    def diff(old: DeckRegistry, new: DeckRegistry) -> dict:
+        changes = dict()
+        for category_id in set(old) | set(new):
+            if (before := old.get(category_id)) is None:
+                changes[category_id] = 'added'
+            elif (after := new.get(category_id)) is None:
+                changes[category_id] = 'removed'
+            elif before.name != after.name or before.to_channel_topic() != after.to_channel_topic() \
+                    or getattr(before.role, 'id', None) != getattr(after.role, 'id', None):
+                changes[category_id] = 'changed'
+        return changes
+
+    def _index_members(self):
+        role_members = {deck.role.id: set() for deck in self.decks.values() if deck.role is not None}
+        for member in self.guild.members:
+            for role in member.roles:
+                if (member_ids := role_members.get(role.id)) is not None:
+                    member_ids.add(member.id)
+        self.role_members = role_members
+
+    def get_deck_members(self, deck: Deck) -> list:
+        """
+        Returns the members with the role of ``deck`` from the member cache, in the order of their ids.
+        """
+        if deck.role is None:
+            return list()
+        if (member_ids := self.role_members.get(deck.role.id)) is None:
+            role = self.guild.get_role(deck.role.id)
+            member_ids = self.role_members[deck.role.id] = {member.id for member in role.members} if role else set()
+        return [member for member_id in sorted(member_ids) if (member := self.guild.get_member(member_id)) is not None]
+
+    def update_member(self, before: Member, after: Member):
+        if self.guild is None or after.guild.id != self.guild.id or before.roles == after.roles:
+            return
+        before_ids = {role.id for role in before.roles}
+        after_ids = {role.id for role in after.roles}
+        for role_id in after_ids - before_ids:
+            if (member_ids := self.role_members.get(role_id)) is not None:
+                member_ids.add(after.id)
+        for role_id in before_ids - after_ids:
+            if (member_ids := self.role_members.get(role_id)) is not None:
+                member_ids.discard(after.id)
+
+    def remove_member(self, member: Member):
+        if self.guild is None or member.guild.id != self.guild.id:
+            return
+        for member_ids in self.role_members.values():
+            member_ids.discard(member.id)
 
     async def update_deck(self, deck: Deck):
-        async def _update_deck():
-            self.changes.append(deck.category_channel.id)
-            await asyncio.sleep(self.UPDATE_DELAY)
-            if self.changes.count(deck.category_channel.id) == 1 \
-                    and deck.default_channel.topic != (new_topic := deck.to_channel_topic()):
-                await deck.default_channel.edit(topic=new_topic)
-            if deck.category_channel.id in self.changes:
-                self.changes.remove(deck.category_channel.id)
         self.decks[deck.category_channel.id] = deck
-        self.client.loop.create_task(_update_deck())
+        self.writer.schedule(deck)
+
+    async def flush_decks(self):
+        await self.writer.flush_all()
+        self.save_snapshot()
 
     async def add_deck(self, name: str, manager: Member):
         role: object = await self.guild.create_role(name=name)
@@ -214,19 +414,39 @@ class DeckHandler:
         self.decks[deck.category_channel.id] = deck
         return deck
 
-    async def remove_deck(self, deck: Deck):
-        tasks = [self.remove_channel(channel, deck) for channel in deck.category_channel.channels]
-        tasks.extend([deck.role.delete()])
-        del self.decks[deck.category_channel.id]
-        remove_manager_role = True
-        for d in self.decks.values():
-            if deck.manager == d.manager:
-                remove_manager_role = False
-                break
-        if remove_manager_role:
-            tasks.append(deck.manager.remove_roles(self.manager_role))
-        await asyncio.wait(tasks)
-        await deck.category_channel.delete()
+    async def remove_deck(self, deck: Deck, progress=None) -> BulkReport:
+        """
+        Moves the channels of ``deck`` to the recycle bin and deletes its role, then deletes the category once every
+        other operation succeeded. If any operation, the category deletion included, fails, the deck is kept, across
+        refreshes too, so that the removal can be retried.
+        """
+        category_id = deck.category_channel.id
+        self.decks.remove(category_id)
+        role = deck.role
+        operations = list()
+        if role is not None:
+            operations.append(role.delete)
+        if not self.decks.get_by_manager(deck.manager.id):
+            operations.append(lambda: deck.manager.remove_roles(self.manager_role))
+        executor = BulkExecutor(concurrency=self.FETCH_CONCURRENCY, progress=progress,
+                                route=lambda item: 'channel' if isinstance(item, GuildChannel) else 'role')
+        report = await executor.run(
+            [*deck.category_channel.channels, *operations],
+            lambda item: self.remove_channel(item, deck) if isinstance(item, GuildChannel) else item())
+        if not report.failed:
+            report.total += 1
+            await executor.apply(deck.category_channel, lambda category: category.delete(), report)
+        if role is not None and role.delete in report.done:
+            deck.role = None
+        if report.failed:
+            self.unfinished_removals[category_id] = deck
+            self.decks[category_id] = deck
+        else:
+            self.unfinished_removals.pop(category_id, None)
+            if role is not None:
+                self.role_members.pop(role.id, None)
+        self.version += 1
+        return report
 
     async def remove_channel(self, channel: Union[TextChannel, VoiceChannel], deck: Deck = None):
         if deck is None:
@@ -239,19 +459,20 @@ class DeckHandler:
         if isinstance(channel, CategoryChannel):
             return self.decks.get(channel.id)
 
+    def get_deck_by_channel_id(self, channel_id: int):
+        if (deck := self.decks.get_by_channel_id(channel_id)) is not None:
+            return deck
+        if self.guild is not None and (channel := self.guild.get_channel(channel_id)) is not None:
+            return self.get_deck_by_channel(channel)
+
     def get_deck_by_id(self, id_: str):
-        deck = [deck for deck in self.decks.values() if deck.id == id_]
-        if deck:
-            return deck[0]
+        return self.decks.get_by_id(id_)
 
     def get_deck_by_name(self, name: str):
-        deck = [deck for deck in self.decks.values() if deck.name == name]
-        if deck:
-            return deck[0]
+        return self.decks.get_by_name(name)
 
     def find_decks_by_topic(self, keyword: str):
-        decks = [deck for deck in self.decks.values() if keyword in deck.topic]
-        return decks
+        return self.decks.search_topic(keyword)
 
     def is_valid_id(self, id_: str):
         return match(self.VALID_ID_REGEX, id_) is not None
@@ -290,14 +511,17 @@ class DeckConverter(Converter):
         if isinstance(argument, Deck):
             return argument
         deck_handler = DeckHandler(ctx.bot)
-        if not deck_handler.ready:
-            raise CommandError('deck handler is not ready')
+        await deck_handler.wait_until_ready()
         deck = deck_handler.get_deck_by_id(argument)
         if deck is not None:
             return deck
         deck = deck_handler.get_deck_by_name(argument)
         if deck is not None:
             return deck
+        if (channel_id := CHANNEL_ID_REGEX.match(argument)) is not None:
+            deck = deck_handler.get_deck_by_channel_id(int(channel_id.group(1)))
+            if deck is not None:
+                return deck
 
         async def convert_with(converter: Converter):
             try:
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from utils.hangul import SYLLABLE_BASE, SYLLABLE_JAMOS, CHAR_INITIALS
+
+INITIALS = frozenset(CHAR_INITIALS)
+
+
+def normalize(text: str) -> str:
+    return ' '.join(text.split()).casefold()
+
+
+def to_initials(text: str) -> str:
+    """
+    Replaces every Hangul syllable with its initial consonant, so that '슈텔로' can be found with 'ㅅㅌㄹ'.
+    """
+    return ''.join(SYLLABLE_JAMOS[ord(c) - SYLLABLE_BASE][0] if 0 <= ord(c) - SYLLABLE_BASE < len(SYLLABLE_JAMOS)
+                   else c for c in text)
+
+
+def ngrams(text: str, n: int) -> set:
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class DeckRegistry:
+    """
+    Decks keyed by category channel id, indexed by deck id, normalized name, manager id, role id and channel id.
+
+    Topics are kept in an inverted index of character bigrams, which for Korean text are syllable bigrams, and of
+    the bigrams of their initial consonants. Call ``add`` again after mutating a deck to refresh its index entries;
+    every change bumps ``revision`` and drops the cached brief lists.
+    """
+    NGRAM = 2
+    FLAGS = ('public', 'nsfw', 'auto', 'lock', 'pending')
+
+    def __init__(self, decks: Iterable = ()):
+        self.decks: dict = dict()
+        self.by_id: dict = dict()
+        self.by_name: dict = dict()
+        self.by_manager: dict = dict()
+        self.by_role: dict = dict()
+        self.by_channel: dict = dict()
+        self.topics: dict = dict()
+        self.postings: dict = dict()
+        self.by_flag: dict = {flag: set() for flag in self.FLAGS}
+        self.keys: dict = dict()
+        self.revision: int = 0
+        self.briefs: dict = dict()
+        for deck in decks:
+            self.add(deck)
+
+    def __len__(self):
+        return len(self.decks)
+
+    def __iter__(self):
+        return iter(self.decks)
+
+    def __contains__(self, category_id: int):
+        return category_id in self.decks
+
+    def __getitem__(self, category_id: int):
+        return self.decks[category_id]
+
+    def __setitem__(self, category_id: int, deck):
+        self.add(deck, category_id)
+
+    def __delitem__(self, category_id: int):
+        if self.remove(category_id) is None:
+            raise KeyError(category_id)
+
+    def get(self, category_id: int, default=None):
+        return self.decks.get(category_id, default)
+
+    def values(self):
+        return self.decks.values()
+
+    def items(self):
+        return self.decks.items()
+
+    def add(self, deck, category_id: int = None):
+        if category_id is None:
+            category_id = deck.category_channel.id
+        self.remove(category_id)
+        manager_id = deck.manager.id if deck.manager is not None else None
+        role_id = deck.role.id if deck.role is not None else None
+        channel_ids = {category_id}
+        if deck.default_channel is not None:
+            channel_ids.add(deck.default_channel.id)
+        if deck.category_channel is not None:
+            channel_ids.update(channel.id for channel in deck.category_channel.channels)
+        topic = normalize(deck.topic)
+        initials = to_initials(topic)
+        grams = ngrams(topic, self.NGRAM) | ngrams(initials, self.NGRAM)
+        flags = tuple(flag for flag in self.FLAGS if getattr(deck, flag))
+        self.decks[category_id] = deck
+        self.by_id[deck.id] = deck
+        self.by_name[normalize(deck.name)] = deck
+        self.by_manager.setdefault(manager_id, dict())[category_id] = deck
+        if role_id is not None:
+            self.by_role[role_id] = deck
+        for channel_id in channel_ids:
+            self.by_channel[channel_id] = deck
+        self.topics[category_id] = (topic, initials)
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(category_id)
+        for flag in flags:
+            self.by_flag[flag].add(category_id)
+        self.keys[category_id] = (deck.id, normalize(deck.name), manager_id, role_id, channel_ids, grams, flags)
+        self.touch()
+
+    def remove(self, category_id: int):
+        if (deck := self.decks.pop(category_id, None)) is None:
+            return None
+        id_, name, manager_id, role_id, channel_ids, grams, flags = self.keys.pop(category_id)
+        if self.by_id.get(id_) is deck:
+            del self.by_id[id_]
+        if self.by_name.get(name) is deck:
+            del self.by_name[name]
+        if (managed := self.by_manager.get(manager_id)) is not None:
+            managed.pop(category_id, None)
+            if not managed:
+                del self.by_manager[manager_id]
+        if self.by_role.get(role_id) is deck:
+            del self.by_role[role_id]
+        for channel_id in channel_ids:
+            if self.by_channel.get(channel_id) is deck:
+                del self.by_channel[channel_id]
+        del self.topics[category_id]
+        for gram in grams:
+            if (posting := self.postings.get(gram)) is not None:
+                posting.discard(category_id)
+                if not posting:
+                    del self.postings[gram]
+        for flag in flags:
+            self.by_flag[flag].discard(category_id)
+        self.touch()
+        return deck
+
+    def touch(self):
+        self.revision += 1
+        self.briefs.clear()
+
+    def get_by_id(self, id_: str):
+        return self.by_id.get(id_)
+
+    def get_by_name(self, name: str):
+        return self.by_name.get(normalize(name))
+
+    def get_by_role_id(self, role_id: int):
+        return self.by_role.get(role_id)
+
+    def get_by_channel_id(self, channel_id: int):
+        return self.by_channel.get(channel_id)
+
+    def get_by_manager(self, manager_id: int) -> list:
+        return list(self.by_manager.get(manager_id, dict()).values())
+
+    def get_by_flag(self, flag: str) -> list:
+        return [self.decks[category_id] for category_id in self.by_flag[flag]]
+
+    def sorted_briefs(self, flag: str = None) -> list:
+        """
+        Returns the briefs of every deck, or of the decks with ``flag`` set, sorted by deck id.
+        """
+        if (briefs := self.briefs.get(flag)) is None:
+            decks = self.decks.values() if flag is None else self.get_by_flag(flag)
+            briefs = self.briefs[flag] = [deck.get_brief() for deck in sorted(decks, key=lambda deck: deck.id)]
+        return briefs
+
+    def search_topic(self, keyword: str) -> list:
+        """
+        Returns the decks whose topic contains ``keyword``, or whose initial consonants match it when it is written
+        only with initial consonants, ranked by the number of occurrences and then by the earliest occurrence.
+        """
+        if not (keyword := normalize(keyword)):
+            return list()
+        by_initials = all(c in INITIALS or c == ' ' for c in keyword)
+        candidates = set(self.decks) if len(keyword) < self.NGRAM else None
+        for gram in ngrams(keyword, self.NGRAM) if candidates is None else ():
+            posting = self.postings.get(gram, set())
+            candidates = posting.copy() if candidates is None else candidates & posting
+            if not candidates:
+                return list()
+        ranked = list()
+        for category_id in candidates:
+            topic, initials = self.topics[category_id]
+            text = initials if by_initials else topic
+            if (position := text.find(keyword)) >= 0:
+                ranked.append((-text.count(keyword), position, self.decks[category_id].id, category_id))
+        return [self.decks[item[-1]] for item in sorted(ranked)]
@@ -0,0 +1,37 @@
+import json
+from os import makedirs, replace
+from os.path import dirname, exists
+
+from utils import Log
+
+
+def to_record(deck) -> dict:
+    header = deck.to_deck_topic()
+    return {'category_id': deck.category_channel.id, 'default_channel_id': deck.default_channel.id,
+            'role_id': deck.role.id if deck.role is not None else None, 'name': deck.name, 'id': header.id,
+            'settings': list(header.settings), 'manager_id': header.manager_id,
+            'pending_ids': list(header.pending_ids), 'topic': header.topic}
+
+
+def dump(decks, path: str):
+    """
+    Writes one JSON line per deck, replacing the previous snapshot only once the new one is complete.
+    """
+    makedirs(dirname(path), exist_ok=True)
+    with open(temp := path + '.tmp', mode='wt', encoding='utf-8') as f:
+        for deck in decks:
+            f.write(json.dumps(to_record(deck), ensure_ascii=False) + '\n')
+    replace(temp, path)
+
+
+def load(path: str) -> list:
+    if not exists(path):
+        return list()
+    records = list()
+    with open(path, mode='rt', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                Log.error(f'skipping line {number} of deck snapshot: {e}')
+    return records
@@ -0,0 +1,68 @@
+import re
+from typing import NamedTuple, Optional
+
+PUBLIC_EMOJI = ':white_check_mark:'
+NSFW_EMOJI = ':underage:'
+AUTO_EMOJI = ':robot:'
+LOCK_EMOJI = ':lock:'
+SETTING_EMOJIS = (PUBLIC_EMOJI, NSFW_EMOJI, AUTO_EMOJI, LOCK_EMOJI)
+
+MANAGER = '매니저'
+PENDING = '가입신청자'
+
+MENTION_REGEX = re.compile('<@!?(\\d+)>')
+
+_SETTING = '(?:{0})'.format('|'.join(re.escape(emoji) for emoji in SETTING_EMOJIS))
+_MENTION = '<@!?\\d+>'
+TOPIC_REGEX = re.compile(
+    '\\*id: (?P<id>[0-9A-Za-z_]{4,})'
+    '(?:\\n(?P<settings>' + _SETTING + '(?: ' + _SETTING + ')*))?'
+    '\\n' + MANAGER + ': <@!?(?P<manager>\\d+)>'
+    '(?:\\n' + PENDING + ':(?P<pending>(?: ' + _MENTION + ')+))?'
+    '(?:\\n[^\\n]*(?:\\n(?P<topic>.*))?)?',
+    re.DOTALL)
+
+
+class DeckTopic(NamedTuple):
+    """
+    Header of a deck written in the topic of its default channel, followed by the topic of the deck itself:
+
+        *id: <id>
+        [<setting emoji> ...]
+        매니저: <mention>
+        [가입신청자: <mention> ...]
+
+        <topic>
+    """
+    id: str
+    settings: tuple
+    manager_id: int
+    pending_ids: tuple
+    topic: str
+
+
+def parse(raw: Optional[str]) -> Optional[DeckTopic]:
+    if raw is None or (matched := TOPIC_REGEX.fullmatch(raw)) is None:
+        return None
+    settings, pending = matched.group('settings', 'pending')
+    return DeckTopic(id=matched.group('id'),
+                     settings=tuple(settings.split(' ')) if settings else (),
+                     manager_id=int(matched.group('manager')),
+                     pending_ids=tuple(int(id_) for id_ in MENTION_REGEX.findall(pending)) if pending else (),
+                     topic=matched.group('topic') or '')
+
+
+def serialize(deck_topic: DeckTopic) -> str:
+    lines = ['*id: ' + deck_topic.id]
+    if deck_topic.settings:
+        lines.append(' '.join(deck_topic.settings))
+    lines.append(f'{MANAGER}: <@{deck_topic.manager_id}>')
+    if deck_topic.pending_ids:
+        lines.append(PENDING + ':' + ''.join(f' <@{id_}>' for id_ in deck_topic.pending_ids))
+    lines.append('')
+    lines.append(deck_topic.topic)
+    return '\n'.join(lines)
+
+
+def settings_of(public: bool, nsfw: bool, auto: bool, lock: bool) -> tuple:
+    return tuple(emoji for emoji, enabled in zip(SETTING_EMOJIS, (public, nsfw, auto, lock)) if enabled)
@@ -0,0 +1,95 @@
+import asyncio
+from time import monotonic
+from typing import Optional
+
+from discord import HTTPException
+
+from utils import Log
+
+
+class PendingTopic:
+    __slots__ = ('deck', 'due', 'edits', 'task')
+
+    def __init__(self, deck, due: float):
+        self.deck = deck
+        self.due: float = due
+        self.edits: int = 1
+        self.task: Optional[asyncio.Task] = None
+
+
+class DeckTopicWriter:
+    """
+    Writes the channel topics of edited decks behind the edits.
+
+    Each deck has at most one pending write. An edit made while one is pending replaces its deck and pushes it back by
+    ``delay`` seconds, and the topic of a channel is written at most once every ``min_interval`` seconds, since
+    Discord allows only two topic edits per channel in ten minutes.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, request, *, delay: float, min_interval: float):
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.request = request
+        self.delay: float = delay
+        self.min_interval: float = min_interval
+        self.pending: dict = dict()
+        self.flushing: set = set()
+        self.written: dict = dict()
+        self.written_at: dict = dict()
+        self.stats: dict = {'scheduled': 0, 'coalesced': 0, 'written': 0, 'unchanged': 0, 'errors': 0}
+
+    def last_written(self, channel_id: int) -> Optional[str]:
+        return self.written.get(channel_id)
+
+    def schedule(self, deck):
+        self.stats['scheduled'] += 1
+        due = monotonic() + self.delay
+        if (written_at := self.written_at.get(deck.default_channel.id)) is not None:
+            due = max(due, written_at + self.min_interval)
+        if (entry := self.pending.get(key := deck.category_channel.id)) is not None:
+            self.stats['coalesced'] += 1
+            entry.deck = deck
+            entry.due = due
+            entry.edits += 1
+            return
+        entry = self.pending[key] = PendingTopic(deck, due)
+        entry.task = self.loop.create_task(self._flush_later(key, entry))
+
+    async def _flush_later(self, key: int, entry: PendingTopic):
+        while (delay := entry.due - monotonic()) > 0:
+            await asyncio.sleep(delay)
+        self.flushing.add(task := entry.task)
+        try:
+            await self._flush(key, entry)
+        finally:
+            self.flushing.discard(task)
+
+    async def _flush(self, key: int, entry: PendingTopic):
+        if self.pending.get(key) is entry:
+            del self.pending[key]
+        channel = entry.deck.default_channel
+        topic = entry.deck.to_channel_topic()
+        if self.written.get(channel.id, channel.topic) == topic:
+            self.stats['unchanged'] += 1
+            return
+        try:
+            await self.request(channel.edit(topic=topic))
+        except HTTPException as e:
+            self.stats['errors'] += 1
+            Log.error(f'failed to write the topic of deck {entry.deck.name}: {e}')
+            return
+        self.written[channel.id] = topic
+        self.written_at[channel.id] = monotonic()
+        self.stats['written'] += 1
+
+    async def flush_all(self):
+        """
+        Writes every pending topic now, and waits for the writes already in flight.
+        """
+        entries = list(self.pending.items())
+        for _, entry in entries:
+            entry.task.cancel()
+        await asyncio.gather(*[self._flush(key, entry) for key, entry in entries], *self.flushing,
+                             return_exceptions=True)
+        if entries:
+            Log.auto('deck topics flushed: {flushed} pending, {scheduled} scheduled, {coalesced} coalesced, '
+                     '{written} written'.format(flushed=len(entries), **self.stats))
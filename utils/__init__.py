@@ -1,9 +1,9 @@
-from .fresh_data import FreshData
+from .fresh_data import FreshCache
 from .singleton_decorator import singleton  # singleton should be imported before literal
 from .literal import get_cog, get_path, get_help, get_brief, get_constant, literals, get_check, reload_literals, \
-    get_emoji
+    get_emoji, watch_literals
 from .log import Log
-from .splitter import wrap_codeblock, split_by_length
+from .splitter import wrap_codeblock, split_by_length, iter_codeblocks, iter_by_length
 from .check_length import check_length
 from .try_to import try_to_clear_reactions
 from .interfaces import attach_toggle_interface, InterfaceState, attach_page_interface
@@ -1,14 +1,93 @@
-from datetime import datetime
+import asyncio
+import inspect
+from collections import OrderedDict
+from time import monotonic
 
 
-class FreshData:
-    def __init__(self, data, expire_after):
-        self._data = data
-        self.timestamp = datetime.now()
-        self.expire_after = expire_after  # seconds
+class FreshEntry:
+    __slots__ = ('value', 'fresh_until', 'stale_until')
 
-    @property
-    def data(self):
-        if (datetime.now() - self.timestamp).total_seconds() > self.expire_after:
-            self._data = None
-        return self._data
+    def __init__(self, value, expire_after: float, stale_for: float):
+        self.value = value
+        self.fresh_until = monotonic() + expire_after
+        self.stale_until = self.fresh_until + stale_for
+
+
+class FreshCache:
+    """
+    Keyed cache whose entries expire ``expire_after`` seconds after they were loaded.
+
+    For ``stale_for`` more seconds an expired entry is still served while a single background task reloads it.
+    Concurrent loads of the same key share one call of the loader, and at most ``max_size`` keys are kept,
+    evicting the least recently used one.
+    """
+
+    def __init__(self, expire_after: float, *, stale_for: float = 0, max_size: int = 128):
+        self.expire_after: float = expire_after
+        self.stale_for: float = stale_for
+        self.max_size: int = max_size
+        self.entries: OrderedDict = OrderedDict()
+        self.loading: dict = dict()
+        self.stats: dict = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'coalesced': 0, 'refreshes': 0,
+                            'evictions': 0, 'errors': 0}
+
+    def __contains__(self, key):
+        return self.peek(key) is not None
+
+    def peek(self, key, default=None):
+        if (entry := self.entries.get(key)) is None or entry.stale_until < monotonic():
+            return default
+        return entry.value
+
+    def set(self, key, value):
+        self.entries[key] = FreshEntry(value, self.expire_after, self.stale_for)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+        return value
+
+    def invalidate(self, key=None):
+        if key is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(key, None)
+
+    async def get(self, key, loader):
+        """
+        Returns the cached value of ``key``, calling ``loader()`` (a function or a coroutine function) on a miss.
+        """
+        now = monotonic()
+        if (entry := self.entries.get(key)) is not None and entry.stale_until >= now:
+            self.entries.move_to_end(key)
+            if entry.fresh_until >= now:
+                self.stats['hits'] += 1
+            else:
+                self.stats['stale_hits'] += 1
+                if key not in self.loading:
+                    self.stats['refreshes'] += 1
+                    self._load(key, loader)
+            return entry.value
+        if key in self.loading:
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['misses'] += 1
+            self._load(key, loader)
+        return await asyncio.shield(self.loading[key])
+
+    def _load(self, key, loader):
+        async def load():
+            try:
+                value = loader()
+                if inspect.isawaitable(value):
+                    value = await value
+                return self.set(key, value)
+            except Exception:
+                self.stats['errors'] += 1
+                raise
+            finally:
+                del self.loading[key]
+
+        task = self.loading[key] = asyncio.get_event_loop().create_task(load())
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())  # retrieved by the waiters, if any
+        return task
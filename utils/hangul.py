@@ -3,6 +3,8 @@ __all__ = ["split_syllable_char", "split_syllables",
            "CHAR_INITIALS", "CHAR_MEDIALS", "CHAR_FINALS"]
 
 import itertools
+import re
+from functools import lru_cache
 
 INITIAL = 0x001
 MEDIAL = 0x010
@@ -35,6 +37,17 @@ CHAR_SETS = {k: set(v) for k, v in CHAR_LISTS.items()}
 CHARSET = set(itertools.chain(*CHAR_SETS.values()))
 CHAR_INDICES = {k: {c: i for i, c in enumerate(v)}
                 for k, v in CHAR_LISTS.items()}
+JAMO_TYPES = {c: sum(t for t, s in CHAR_SETS.items() if c in s) for c in CHARSET}
+
+SYLLABLE_BASE = 0xac00
+SYLLABLE_LAST = 0xd7a3
+# (initial, medial, final or None) of every syllable in 'Hangul Syllables', indexed by ord(c) - SYLLABLE_BASE
+SYLLABLE_JAMOS = tuple((CHAR_INITIALS[i], CHAR_MEDIALS[m], CHAR_FINALS[f - 1] if f else None)
+                       for i in range(len(CHAR_INITIALS))
+                       for m in range(len(CHAR_MEDIALS))
+                       for f in range(len(CHAR_FINALS) + 1))
+SPLIT_TABLE = {SYLLABLE_BASE + i: ''.join(filter(None, jamos)) for i, jamos in enumerate(SYLLABLE_JAMOS)}
+UNSUPPORTED_REGEX = re.compile('[^\uac00-\ud7a3\u3130-\u318f]')
 
 
 def is_hangul_syllable(c):
@@ -157,21 +170,26 @@ def split_syllables(s, ignore_err=True, pad=None):
         'ㅇㅏㄴㄴㅕㅇㅎㅏxㅅㅔxㅇㅛxxㅛx'
     """
 
-    def try_split(c):
-        try:
-            return split_syllable_char(c)
-        except ValueError:
-            if ignore_err:
-                return (c,)
-            raise ValueError(f"encountered an unsupported character: "
-                             f"{c} (0x{ord(c):x})")
-
-    s = map(try_split, s)
-    if pad is not None:
-        tuples = map(lambda x: tuple(pad if y is None else y for y in x), s)
-    else:
-        tuples = map(lambda x: filter(None, x), s)
-    return "".join(itertools.chain(*tuples))
+    if not ignore_err and (found := UNSUPPORTED_REGEX.search(s)):
+        c = found.group()
+        raise ValueError(f"encountered an unsupported character: "
+                         f"{c} (0x{ord(c):x})")
+    return s.translate(SPLIT_TABLE if pad is None else get_pad_table(pad))
+
+
+@lru_cache(maxsize=8)
+def get_pad_table(pad):
+    """
+    Builds a `str.translate` table splitting syllables and placing jamos
+    at their position, with empty positions filled by `pad`.
+    """
+    table = {SYLLABLE_BASE + i: "".join(pad if c is None else c for c in jamos)
+             for i, jamos in enumerate(SYLLABLE_JAMOS)}
+    for c, t in JAMO_TYPES.items():
+        pos = INITIAL if t & INITIAL else MEDIAL if t & MEDIAL else FINAL
+        table[ord(c)] = "".join(c if p == pos else pad
+                                for p in (INITIAL, MEDIAL, FINAL))
+    return table
 
 
 def join_jamos_char(init, med, final=None):
@@ -215,54 +233,51 @@ def join_jamos(s, ignore_err=True):
         "안ㄴ녕하세요"
         >>> join_jamos()
     """
+    initials = CHAR_INDICES[INITIAL]
+    medials = CHAR_INDICES[MEDIAL]
+    finals = CHAR_INDICES[FINAL]
     last_t = 0
     queue = []
-    new_string = ""
-
-    def flush(n=0):
-        new_queue = []
-        while len(queue) > n:
-            new_queue.append(queue.pop())
-        if len(new_queue) == 1:
+    new_string = []
+
+    def flush(queue_):
+        if len(queue_) >= 2:
+            init, med = queue_[0], queue_[1]
+            final = queue_[2] if len(queue_) == 3 else None
+            if init in initials and med in medials and (final is None or final in finals):
+                return chr(SYLLABLE_BASE + 28 * 21 * initials[init] + 28 * medials[med]
+                           + (0 if final is None else finals[final] + 1))
             if not ignore_err:
-                raise ValueError(f"invalid jamo character: {new_queue[0]}")
-            result = new_queue[0]
-        elif len(new_queue) >= 2:
-            try:
-                result = join_jamos_char(*new_queue)
-            except (ValueError, KeyError):
-                # Invalid jamo combination
-                if not ignore_err:
-                    raise ValueError(f"invalid jamo characters: {new_queue}")
-                result = "".join(new_queue)
-        else:
-            result = None
-        return result
+                raise ValueError(f"invalid jamo characters: {queue_}")
+        elif not ignore_err:
+            raise ValueError(f"invalid jamo character: {queue_[0]}")
+        return "".join(queue_)
 
     for c in s:
-        if c not in CHARSET:
+        t = JAMO_TYPES.get(c, 0)
+        if not t:
             if queue:
-                new_c = flush() + c
-            else:
-                new_c = c
-            last_t = 0
+                new_string.append(flush(queue))
+                queue = []
+            new_string.append(c)
         else:
-            t = get_jamo_type(c)
-            new_c = None
             if t & FINAL == FINAL:
-                if not (last_t == MEDIAL):
-                    new_c = flush()
+                if last_t != MEDIAL and queue:
+                    new_string.append(flush(queue))
+                    queue = []
             elif t == INITIAL:
-                new_c = flush()
-            elif t == MEDIAL:
-                if last_t & INITIAL == INITIAL:
-                    new_c = flush(1)
-                else:
-                    new_c = flush()
-            last_t = t
-            queue.insert(0, c)
-        if new_c:
-            new_string += new_c
+                if queue:
+                    new_string.append(flush(queue))
+                    queue = []
+            elif last_t & INITIAL == INITIAL:
+                if len(queue) > 1:
+                    new_string.append(flush(queue[:-1]))
+                    queue = queue[-1:]
+            elif queue:
+                new_string.append(flush(queue))
+                queue = []
+            queue.append(c)
+        last_t = t
     if queue:
-        new_string += flush()
-    return new_string
\ No newline at end of file
+        new_string.append(flush(queue))
+    return "".join(new_string)
@@ -1,10 +1,11 @@
 import asyncio
-from typing import Collection
+import heapq
+from typing import Collection, Optional
 
-from discord import Message, Reaction, User, Client
+from discord import Message, RawReactionActionEvent, User
 from discord.ext.commands import Bot
 
-from utils import try_to_clear_reactions, get_emoji
+from utils import try_to_clear_reactions, get_emoji, singleton
 
 DEFAULT_TIMEOUT = 60
 
@@ -30,11 +31,82 @@ class InterfaceState:
 #         self.emoji = emoji
 
 
-def check_reaction(bot: Client, message: Message, user: User, *emojis):
-    def check(reaction_: Reaction, user_: User):
-        return user_ != bot.user and reaction_.message.id == message.id and (user is None or user_ == user) \
-               and reaction_.emoji in emojis
-    return check
+class Interface:
+    def __init__(self, message: Message, emojis: Collection, handler, user: Optional[User], timeout: float):
+        self.message: Message = message
+        self.emojis: Collection = emojis
+        self.handler = handler
+        self.user: Optional[User] = user
+        self.timeout: float = timeout
+        self.deadline: float = 0
+        self.busy: bool = False
+        self.closed: asyncio.Future = asyncio.get_event_loop().create_future()
+
+
+@singleton
+class ReactionRouter:
+    """
+    Dispatches reactions to the interface attached to the reacted message and expires interfaces from one timer.
+    """
+
+    def __init__(self, bot: Bot):
+        self.bot: Bot = bot
+        self.interfaces: dict = dict()
+        self.deadlines: list = list()
+        self.wakeup: asyncio.Event = asyncio.Event()
+        self.timer: Optional[asyncio.Task] = None
+        bot.add_listener(self.on_raw_reaction_add, 'on_raw_reaction_add')
+
+    async def attach(self, message: Message, emojis: Collection, handler, *,
+                     user: User = None, timeout=DEFAULT_TIMEOUT):
+        if (old := self.interfaces.get(message.id)) is not None:
+            self.close(old)
+        interface = self.interfaces[message.id] = Interface(message, emojis, handler, user, timeout)
+        interface.deadline = self.bot.loop.time() + timeout
+        heapq.heappush(self.deadlines, (interface.deadline, message.id))
+        self.wakeup.set()
+        if self.timer is None or self.timer.done():
+            self.timer = self.bot.loop.create_task(self.expire())
+        await interface.closed
+
+    def close(self, interface: Interface):
+        if self.interfaces.get(interface.message.id) is interface:
+            del self.interfaces[interface.message.id]
+        if not interface.closed.done():
+            interface.closed.set_result(None)
+
+    async def expire(self):
+        while self.deadlines:
+            deadline, message_id = self.deadlines[0]
+            if (delay := deadline - self.bot.loop.time()) > 0:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self.deadlines)
+            if (interface := self.interfaces.get(message_id)) is None:
+                continue
+            if interface.busy:
+                interface.deadline = self.bot.loop.time() + interface.timeout
+            if interface.deadline > deadline:
+                heapq.heappush(self.deadlines, (interface.deadline, message_id))
+            else:
+                self.close(interface)
+
+    async def on_raw_reaction_add(self, payload: RawReactionActionEvent):
+        interface = self.interfaces.get(payload.message_id)
+        if interface is None or interface.busy or payload.user_id == self.bot.user.id \
+                or (interface.user is not None and payload.user_id != interface.user.id) \
+                or (emoji := str(payload.emoji)) not in interface.emojis:
+            return
+        interface.busy = True
+        try:
+            await interface.handler(emoji)
+        finally:
+            interface.busy = False
+            interface.deadline = self.bot.loop.time() + interface.timeout
 
 
 async def update_state(message: Message, state: InterfaceState, *clear_emojis):
@@ -44,22 +116,17 @@ async def update_state(message: Message, state: InterfaceState, *clear_emojis):
 async def attach_toggle_interface(bot: Bot, message: Message, primary_state: InterfaceState,
                                   secondary_state: InterfaceState, *,
                                   user: User = None, timeout=DEFAULT_TIMEOUT, after=None):
-    await message.add_reaction(TOGGLE_EXPAND_EMOJI)
-    while True:
-        try:
-            reaction, _ = await bot.wait_for(
-                'reaction_add', timeout=timeout,
-                check=check_reaction(bot, message, user, *TOGGLE_EMOJIS))
-        except asyncio.TimeoutError:
-            await try_to_clear_reactions(message, *TOGGLE_EMOJIS)
-            break
+    async def toggle(emoji: str):
+        if emoji == TOGGLE_EXPAND_EMOJI:
+            await update_state(message, secondary_state, *TOGGLE_EMOJIS)
+            await message.add_reaction(TOGGLE_COLLAPSE_EMOJI)
         else:
-            if reaction.emoji == TOGGLE_EXPAND_EMOJI:
-                await update_state(message, secondary_state, *TOGGLE_EMOJIS)
-                await message.add_reaction(TOGGLE_COLLAPSE_EMOJI)
-            else:
-                await update_state(message, primary_state, *TOGGLE_EMOJIS)
-                await message.add_reaction(TOGGLE_EXPAND_EMOJI)
+            await update_state(message, primary_state, *TOGGLE_EMOJIS)
+            await message.add_reaction(TOGGLE_EXPAND_EMOJI)
+
+    await message.add_reaction(TOGGLE_EXPAND_EMOJI)
+    await ReactionRouter(bot).attach(message, TOGGLE_EMOJIS, toggle, user=user, timeout=timeout)
+    await try_to_clear_reactions(message, *TOGGLE_EMOJIS)
     if after is not None:
         await after
 
@@ -68,26 +135,23 @@ async def attach_page_interface(bot: Bot, message: Message, states: Collection,
                                 user: User = None, timeout=DEFAULT_TIMEOUT, after=None):
     page = 0
     pages = len(states)
+
+    async def turn(emoji: str):
+        nonlocal page
+        if emoji == PAGE_PREV_EMOJI:
+            page = (page - 1) % pages
+        else:
+            page = (page + 1) % pages
+        await update_state(message, states[page], *PAGE_EMOJIS)
+        await message.add_reaction(PAGE_PREV_EMOJI)
+        await message.add_reaction(PAGE_NEXT_EMOJI)
+
     if pages > 1:
         await message.add_reaction(PAGE_PREV_EMOJI)
         await message.add_reaction(PAGE_NEXT_EMOJI)
-        while True:
-            try:
-                reaction, _ = await bot.wait_for(
-                    'reaction_add', timeout=timeout,
-                    check=check_reaction(bot, message, user, *PAGE_EMOJIS))
-            except asyncio.TimeoutError:
-                await try_to_clear_reactions(message, *PAGE_EMOJIS)
-                break
-            else:
-                if reaction.emoji == PAGE_PREV_EMOJI:
-                    page = (page - 1) % pages
-                else:
-                    page = (page + 1) % pages
-                await update_state(message, states[page], *PAGE_EMOJIS)
-                await message.add_reaction(PAGE_PREV_EMOJI)
-                await message.add_reaction(PAGE_NEXT_EMOJI)
+        await ReactionRouter(bot).attach(message, PAGE_EMOJIS, turn, user=user, timeout=timeout)
+        await try_to_clear_reactions(message, *PAGE_EMOJIS)
     else:
-        await asyncio.sleep(timeout)
+        await ReactionRouter(bot).attach(message, (), turn, timeout=timeout)
     if after is not None:
         await after
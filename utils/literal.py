@@ -1,45 +1,76 @@
+import asyncio
 import json
+from os import stat
+from types import MappingProxyType
 
 from utils import singleton
 
+WATCH_INTERVAL = 5
 
-def get_constant(name: str):
-    return Literal().literals[Literal.CONSTANT].get(name)
 
+def _section_getter(section: str):
+    def getter(name: str):
+        return _literal.index.sections[section].get(name)
 
-def get_brief(name: str):
-    return Literal().literals[Literal.BRIEF].get(name)
-
-
-def get_help(name: str):
-    return Literal().literals[Literal.HELP].get(name)
-
-
-def get_path(name: str):
-    return Literal().literals[Literal.PATH].get(name)
-
-
-def get_cog(name: str):
-    return Literal().literals[Literal.COG].get(name)
-
-
-def get_check(name: str):
-    return Literal().literals[Literal.CHECK].get(name)
-
-
-def get_emoji(name: str):
-    return Literal().literals[Literal.EMOJI].get(name)
+    return getter
 
 
 def literals(name: str = ''):
-    l = Literal().literals
-    return l.get(name) if name else l
-
-
-def reload_literals():
-    literal = Literal()
-    literal.load()
-    literal.format_all(literal.literals)
+    index = _literal.index
+    return index.flat.get(name) if name else index.tree
+
+
+def reload_literals(only_if_changed: bool = False):
+    return _literal.load(only_if_changed)
+
+
+async def watch_literals(interval: float = WATCH_INTERVAL):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if reload_literals(True):
+                print('literals reloaded: file changed on disk')
+        except (OSError, ValueError) as e:
+            from utils import Log
+            Log.error(f'failed to reload literals: {e}')
+
+
+class LiteralIndex:
+    """
+    Read-only, pre-formatted view of the literal file.
+
+    ``tree`` keeps the original nesting, ``flat`` maps every top-level name and every dotted path
+    (``'section.key'``) to its value and ``sections`` holds the underscore sections used by the accessors.
+    Top-level names win over dotted paths, so names such as ``'IndianPoker.start'`` keep resolving as before.
+    """
+    __slots__ = ('tree', 'flat', 'sections', 'version')
+
+    def __init__(self, raw: dict, version: tuple = None):
+        prefix = str(raw[Literal.CONSTANT]['default_prefix'])
+        nested = dict()
+        self.tree = self._freeze(raw, prefix, '', nested)
+        flat = dict(self.tree)
+        for path, value in nested.items():
+            flat.setdefault(path, value)
+        self.flat = MappingProxyType(flat)
+        self.sections = {section: self.tree.get(section, MappingProxyType({})) for section in Literal.SECTIONS}
+        self.version = version
+
+    @classmethod
+    def _freeze(cls, d, prefix: str, path: str, nested: dict):
+        if isinstance(d, str):
+            return d.replace(Literal.PREFIX, prefix)
+        if isinstance(d, dict):
+            frozen = dict()
+            for k, v in d.items():
+                key = path + '.' + k if path else k
+                frozen[k] = cls._freeze(v, prefix, key, nested)
+                if path:
+                    nested[key] = frozen[k]
+            return MappingProxyType(frozen)
+        if isinstance(d, list):
+            return tuple(cls._freeze(v, prefix, path, nested) for v in d)
+        return d
 
 
 @singleton
@@ -52,24 +83,38 @@ class Literal:
     COG = '_cog_'
     CHECK = '_check_'
     EMOJI = '_emoji_'
+    SECTIONS = (BRIEF, HELP, PATH, CONSTANT, COG, CHECK, EMOJI)
     PREFIX = '<P>'
 
     def __init__(self):
-        self.literals: dict = dict()
+        self.index: LiteralIndex = None
         self.load()
-        self.format_all(self.literals)
 
-    def load(self):
+    @property
+    def literals(self):
+        return self.index.tree
+
+    @staticmethod
+    def get_version():
+        stat_ = stat(Literal.DEFAULT_PATH)
+        return stat_.st_mtime_ns, stat_.st_size
+
+    def load(self, only_if_changed: bool = False):
+        version = self.get_version()
+        if only_if_changed and self.index is not None and self.index.version == version:
+            return False
         with open(Literal.DEFAULT_PATH, 'r', encoding='utf-8') as f:
-            self.literals = json.load(f)
+            raw = json.load(f)
+        self.index = LiteralIndex(raw, version)  # swapped only after the whole file is compiled
+        return True
 
-    def format_all(self, d):
-        if isinstance(d, str):
-            return d.replace(Literal.PREFIX, str(self.literals[Literal.CONSTANT]['default_prefix']))
-        if isinstance(d, dict):
-            for k, v in d.items():
-                d[k] = self.format_all(v)
-        if isinstance(d, list):
-            for i in range(len(d)):
-                d[i] = self.format_all(d[i])
-        return d
+
+_literal = Literal()
+
+get_constant = _section_getter(Literal.CONSTANT)
+get_brief = _section_getter(Literal.BRIEF)
+get_help = _section_getter(Literal.HELP)
+get_path = _section_getter(Literal.PATH)
+get_cog = _section_getter(Literal.COG)
+get_check = _section_getter(Literal.CHECK)
+get_emoji = _section_getter(Literal.EMOJI)
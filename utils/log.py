@@ -1,7 +1,11 @@
+import atexit
 import inspect
+import sys
 from datetime import datetime
-from os import mkdir
-from os.path import isdir, isfile
+from os import makedirs, rename, remove
+from os.path import isfile, getsize, dirname, splitext
+from queue import Queue
+from threading import Thread
 
 from discord import Message
 from slugify import slugify
@@ -9,16 +13,71 @@ from slugify import slugify
 from utils import get_path, get_constant
 
 
+def get_caller(depth: int, walk_stack: bool = False):
+    if walk_stack:
+        frame = inspect.stack(0)[depth + 1][0]
+    else:
+        frame = sys._getframe(depth + 1)
+    self_ = frame.f_locals.get('self')
+    class_ = self_.__class__.__name__ if self_ is not None else None
+    return class_, frame.f_code.co_name
+
+
+class LogSink:
+    MAX_BYTES = 1024 * 1024
+    BACKUP_COUNT = 5
+
+    def __init__(self):
+        self.queue: Queue = Queue()
+        self.thread: Thread = Thread(target=self._run, name='LogSink', daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def write(self, path: str, context: str):
+        self.queue.put((path, context))
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def _run(self):
+        while (item := self.queue.get()) is not None:
+            try:
+                self._write(*item)
+            except OSError as e:
+                print(f'--not logged : {e}')
+
+    def _write(self, path: str, context: str):
+        if directory := dirname(path):
+            makedirs(directory, exist_ok=True)
+        new_file = not isfile(path)
+        if not new_file and getsize(path) + len(context.encode('utf-8')) > self.MAX_BYTES:
+            self._rotate(path)
+            new_file = True
+        with open(path, mode='wt' if new_file else 'at', encoding='utf-8-sig') as f:
+            f.write(context + '\n')
+        if new_file:
+            print(f'{datetime.now()} - LogSink._write : logs file separated. ({path})')
+
+    def _rotate(self, path: str):
+        stem, ext = splitext(path)
+        if isfile(oldest := f'{stem}.{self.BACKUP_COUNT}{ext}'):
+            remove(oldest)
+        for i in range(self.BACKUP_COUNT - 1, 0, -1):
+            if isfile(backup := f'{stem}.{i}{ext}'):
+                rename(backup, f'{stem}.{i + 1}{ext}')
+        rename(path, f'{stem}.1{ext}')
+
+
 class Log:
+    walk_stack: bool = False  # set True to resolve callers with inspect.stack() as before
+    sink: LogSink = None
+
     @classmethod
     def log(cls, log: str, path: str = '', **kwargs):
         now = datetime.now()
-        stack = inspect.stack()
-        try:
-            class_ = stack[2][0].f_locals["self"].__class__.__name__
-        except KeyError:
-            class_ = None
-        method_ = stack[2][0].f_code.co_name
+        class_, method_ = get_caller(2, cls.walk_stack)
         context = f'{now} - {class_}.{method_} : {log}'
         print(context)
         if not path:
@@ -33,13 +92,9 @@ class Log:
             else:
                 print('--not logged : DM')
                 return
-        # if not isdir(get_path('logs')):
-        #     mkdir(get_path('logs'))
-        # mode = 'at' if isfile(path) else 'wt'
-        # with open(path, mode=mode, encoding='utf-8-sig') as f:
-        #     f.write(context + '\n')
-        # if mode == 'wt':
-        #     cls.command('logs file separated.')
+        if cls.sink is None:
+            cls.sink = LogSink()
+        cls.sink.write(path, context)
 
     @classmethod
     def auto(cls, log: str, **kwargs):
@@ -1,24 +1,56 @@
+from typing import Iterable, Iterator
+
+
 def lensum(*args):
     return sum([len(arg) for arg in args])
 
 
-def wrap_codeblock(content: str, *, max_length: int = 2000, split_paragraph: bool = False, markdown: str = 'md'):
-    blocks = list()
+def iter_codeblocks(lines: Iterable[str], *, max_length: int = 2000, split_paragraph: bool = False,
+                    markdown: str = 'md') -> Iterator[str]:
     prefix = '```' + markdown
     postfix = '\n```'
-    current = ''
+    budget = max_length - lensum(prefix, postfix)
+    current = list()
+    length = 0
+    filled = False
+    for line in lines:
+        if length + len(line) > budget or (split_paragraph and not line.strip()):
+            if filled:
+                yield prefix + ''.join(current) + postfix
+            current = list()
+            length = 0
+            filled = False
+        current.append('\n' + line)
+        length += len(line) + 1
+        filled = filled or bool(line.strip())
+    if filled:
+        yield prefix + ''.join(current) + postfix
+
+
+def wrap_codeblock(content: str, *, max_length: int = 2000, split_paragraph: bool = False, markdown: str = 'md'):
     if not content:
-        return [prefix + '​' + postfix]
-    for line in content.split('\n'):
-        if lensum(prefix, postfix, current, line) > max_length or (split_paragraph and not line.strip()):
-            if current.strip():
-                blocks.append(prefix + current + postfix)
-            current = ''
-        current += '\n' + line
-    if current.strip():
-        blocks.append(prefix + current + postfix)
-    return blocks
+        return ['```' + markdown + '​' + '\n```']
+    return list(iter_codeblocks(content.split('\n'), max_length=max_length, split_paragraph=split_paragraph,
+                                markdown=markdown))
+
+
+def iter_by_length(chunks: Iterable[str], *, max_length: int = 2000) -> Iterator[str]:
+    buffer = list()
+    length = 0
+    for chunk in chunks:
+        start = 0
+        while start < len(chunk):
+            piece = chunk[start:start + max_length - length]
+            start += len(piece)
+            buffer.append(piece)
+            length += len(piece)
+            if length == max_length:
+                yield ''.join(buffer)
+                buffer = list()
+                length = 0
+    if buffer:
+        yield ''.join(buffer)
 
 
 def split_by_length(content: str, *, max_length: int = 2000):
-    return [content[i:i+max_length] for i in range(0, len(content), max_length)]
+    return list(iter_by_length((content,), max_length=max_length))